@@ -1,8 +1,7 @@
 from typing import *
 from pillow_heif import register_heif_opener
 register_heif_opener()
-from airblender.tools import register_tool
-from airblender.tools import *
+from airblender.tools import retrieve_new_scene_element, adjust_layout
 
 from pydantic import BaseModel, Field, conint
 from typing import List, Optional, Dict, Literal, Any
@@ -25,10 +24,94 @@ class SceneElement(BaseModel):
     identifier: Optional[str] = Field(description="ID or Path to the asset file in the database", default=None)
     metadata: Optional[Dict[str, Any]] = Field(description="Additional metadata for the scene element", default=None)
 
+class _ObjTable(dict):
+    """
+    Insertion-ordered scene.objects table that also indexes its elements by category.
+    Note that the index is keyed on each element's category at insertion time.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_cat = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name, elem):
+        if name in self:
+            self._unindex(name)
+        super().__setitem__(name, elem)
+        self._by_cat.setdefault(elem.category, {})[name] = elem
+
+    def __delitem__(self, name):
+        self._unindex(name)
+        super().__delitem__(name)
+
+    def _unindex(self, name):
+        self._by_cat.get(dict.__getitem__(self, name).category, {}).pop(name, None)
+
+    def pop(self, name, *args):
+        if name in self:
+            self._unindex(name)
+        return super().pop(name, *args)
+
+    def popitem(self):
+        name, elem = super().popitem()
+        self._by_cat.get(elem.category, {}).pop(name, None)
+        return name, elem
+
+    def setdefault(self, name, elem=None):
+        if name not in self:
+            self[name] = elem
+        return self[name]
+
+    def update(self, *args, **kwargs):
+        for name, elem in dict(*args, **kwargs).items():
+            self[name] = elem
+
+    def clear(self):
+        super().clear()
+        self._by_cat.clear()
+
+    def by_category(self, category):
+        return list(self._by_cat.get(category, {}).values())
+
 class SceneDef(BaseModel):
-    objects: Dict[str, SceneElement] = Field(description="Dictionary of assets in the scene with asset variable name as keys. The asset variable name should be a valid Python variable name.", default={})
+    objects: Dict[str, SceneElement] = Field(description="Dictionary of assets in the scene with asset variable name as keys. The asset variable name should be a valid Python variable name.", default_factory=_ObjTable)
     room_type: Optional[str] = Field(description="room type", default="an interior scene")
 
+    def by_category(self, category) -> List[SceneElement]:
+        # Validated scenes (e.g. returned by the layout tools) hold a plain dict, so fall back to a scan there
+        if isinstance(self.objects, _ObjTable):
+            return self.objects.by_category(category)
+        return [elem for elem in self.objects.values() if elem.category == category]
+
+    def to_json(self) -> bytes:
+        # orjson is considerably faster than pydantic's json encoder on large scenes, use it if available
+        try:
+            import orjson
+        except ImportError:
+            return self.model_dump_json().encode()
+        return orjson.dumps(self.model_dump())
+
+# The existing scene elements below are trusted literals, so skip pydantic validation when building them. Only the
+# given fields are passed, so model_construct fills in the defaults and model_fields_set matches the parse_obj path.
+# Anything coming back from the retrieval / layout tools still goes through the validating constructors.
+def _placement(position):
+    return Placement.model_construct(position=position)
+
+def _material(id, description):
+    return Material.model_construct(id=id, description=description)
+
+def _make(**kw):
+    return SceneElement.model_construct(**kw)
+
+# Walls only differ in position and polygon
+_WALLS = [
+    ([-3.0, -4.0, 2.25], [[-3.0, -4.0, 0], [-3.0, -4.0, 0], [-3.0, -4.0, 4.5], [-3.0, -4.0, 4.5]]),
+    ([0.0, -4.0, 2.25], [[-3.0, -4.0, 0], [3.0, -4.0, 0], [3.0, -4.0, 4.5], [-3.0, -4.0, 4.5]]),
+    ([3.0, 0.0, 2.25], [[3.0, -4.0, 0], [3.0, 4.0, 0], [3.0, 4.0, 4.5], [3.0, -4.0, 4.5]]),
+    ([0.0, 4.0, 2.25], [[3.0, 4.0, 0], [-3.0, 4.0, 0], [-3.0, 4.0, 4.5], [3.0, 4.0, 4.5]]),
+    ([-3.0, 0.0, 2.25], [[-3.0, 4.0, 0], [-3.0, -4.0, 0], [-3.0, -4.0, 4.5], [-3.0, 4.0, 4.5]]),
+]
+
 scene = SceneDef()
 """
 Let's follow a systematic approach to add living room assets to the existing scene.
@@ -79,14 +162,11 @@ By calling the function, we can visualize the updated scene.
 """
 scene.room_type = "warehouse"
 # Existing Scene Elements
-scene.objects['wall_0'] = SceneElement.parse_obj({'category': 'walls', 'placements': [{'position': [-3.0, -4.0, 2.25]}], 'material': {'id': 'Bricks074', 'description': 'exposed brick, rough'}, 'metadata': {'polygon': [[-3.0, -4.0, 0], [-3.0, -4.0, 0], [-3.0, -4.0, 4.5], [-3.0, -4.0, 4.5]]}})
-scene.objects['wall_1'] = SceneElement.parse_obj({'category': 'walls', 'placements': [{'position': [0.0, -4.0, 2.25]}], 'material': {'id': 'Bricks074', 'description': 'exposed brick, rough'}, 'metadata': {'polygon': [[-3.0, -4.0, 0], [3.0, -4.0, 0], [3.0, -4.0, 4.5], [-3.0, -4.0, 4.5]]}})
-scene.objects['wall_2'] = SceneElement.parse_obj({'category': 'walls', 'placements': [{'position': [3.0, 0.0, 2.25]}], 'material': {'id': 'Bricks074', 'description': 'exposed brick, rough'}, 'metadata': {'polygon': [[3.0, -4.0, 0], [3.0, 4.0, 0], [3.0, 4.0, 4.5], [3.0, -4.0, 4.5]]}})
-scene.objects['wall_3'] = SceneElement.parse_obj({'category': 'walls', 'placements': [{'position': [0.0, 4.0, 2.25]}], 'material': {'id': 'Bricks074', 'description': 'exposed brick, rough'}, 'metadata': {'polygon': [[3.0, 4.0, 0], [-3.0, 4.0, 0], [-3.0, 4.0, 4.5], [3.0, 4.0, 4.5]]}})
-scene.objects['wall_4'] = SceneElement.parse_obj({'category': 'walls', 'placements': [{'position': [-3.0, 0.0, 2.25]}], 'material': {'id': 'Bricks074', 'description': 'exposed brick, rough'}, 'metadata': {'polygon': [[-3.0, 4.0, 0], [-3.0, -4.0, 0], [-3.0, -4.0, 4.5], [-3.0, 4.0, 4.5]]}})
-scene.objects['floors'] = SceneElement.parse_obj({'category': 'floors', 'placements': [{'position': [0.0, 0.0, 0.0]}], 'bbox_size': [6.0, 8.0, 0.0], 'material': {'id': 'Concrete042A', 'description': 'polished concrete, smooth'}, 'metadata': {'polygon': [[-3.0, -4.0, 0.0], [3.0, -4.0, 0.0], [3.0, 4.0, 0.0], [-3.0, 4.0, 0.0]]}})
-scene.objects['ceilings'] = SceneElement.parse_obj({'category': 'ceilings', 'placements': [{'position': [0.0, 0.0, 0.0]}], 'bbox_size': [6.0, 8.0, 0.0], 'material': {'id': 'ManholeCover007', 'description': 'steel beams, industrial finish'}, 'metadata': {'polygon': [[-3.0, -4.0, 4.5], [3.0, -4.0, 4.5], [3.0, 4.0, 4.5], [-3.0, 4.0, 4.5]]}})
-scene.objects['default_light'] = SceneElement.parse_obj({'description': 'default light at the center of the room', 'category': 'lights', 'placements': [{'position': [0.0, 0.0, 1.6]}], 'metadata': {'light_intensity': 40, 'light_type': 'point', 'light_color': [255, 255, 255]}})
+for i, (position, polygon) in enumerate(_WALLS):
+    scene.objects[f'wall_{i}'] = _make(category='walls', placements=[_placement(position)], material=_material('Bricks074', 'exposed brick, rough'), metadata={'polygon': polygon})
+scene.objects['floors'] = _make(category='floors', placements=[_placement([0.0, 0.0, 0.0])], bbox_size=[6.0, 8.0, 0.0], material=_material('Concrete042A', 'polished concrete, smooth'), metadata={'polygon': [[-3.0, -4.0, 0.0], [3.0, -4.0, 0.0], [3.0, 4.0, 0.0], [-3.0, 4.0, 0.0]]})
+scene.objects['ceilings'] = _make(category='ceilings', placements=[_placement([0.0, 0.0, 0.0])], bbox_size=[6.0, 8.0, 0.0], material=_material('ManholeCover007', 'steel beams, industrial finish'), metadata={'polygon': [[-3.0, -4.0, 4.5], [3.0, -4.0, 4.5], [3.0, 4.0, 4.5], [-3.0, 4.0, 4.5]]})
+scene.objects['default_light'] = _make(description='default light at the center of the room', category='lights', placements=[_placement([0.0, 0.0, 1.6])], metadata={'light_intensity': 40, 'light_type': 'point', 'light_color': [255, 255, 255]})
 
 
 # Step 1: Retrieve Assets
@@ -1647,7 +1647,7 @@ class StarterSemanticActionPrimitives(BaseActionPrimitiveSet):
         Returns:
             3-array: (x,y,z) Position in the world frame
         """
-        aabb_center, aabb_extent = target_obj.aabb_center, target_obj.aabb_extent
+        aabb_center, aabb_extent = target_obj.aabb_center_extent
         # We want to sample only from the side-facing faces.
         face_normal_axis = np.random.choice([0, 1])
         face_normal_direction = np.random.choice([-1, 1])
@@ -86,8 +86,7 @@ def main(random_selection=False, headless=False, short_exec=False):
 
         print(f"{info}{' ' * (110 - len(info))}", end="\r")
 
-    for _ in range(100):
-        og.sim.step()
+    og.sim.step(n_steps=100)
 
     print("\nCloth state:\n")
 
@@ -51,8 +51,7 @@ def main(random_selection=False, headless=False, short_exec=False):
         og.sim.enable_viewer_camera_teleoperation()
 
         # Hold still briefly so viewer can see robot
-        for _ in range(100):
-            og.sim.step()
+        og.sim.step(n_steps=100)
 
         # Then apply random actions for a bit
         for _ in range(30):
@@ -1,4 +1,11 @@
-import sys
 from omnigibson.utils.lazy_import_utils import LazyImporter
 
-sys.modules[__name__] = LazyImporter("", None)
+_importer = LazyImporter("", None)
+
+
+def __getattr__(name):
+    # PEP 562 hook: only called when @name isn't already a module global. Resolve it once through the lazy
+    # importer and store the result, so subsequent lookups are plain module attribute reads
+    value = getattr(_importer, name)
+    globals()[name] = value
+    return value
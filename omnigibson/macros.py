@@ -63,6 +63,10 @@ gm.RENDER_VIEWER_CAMERA = True
 # logging messages
 gm.DEBUG = (os.getenv("OMNIGIBSON_DEBUG", 'False').lower() in ('true', '1', 't'))
 
+# Whether to cache the listing of all dataset object models on disk (under <DATASET_PATH>/.cache), so that it does
+# not need to be regenerated by walking the entire dataset every time
+gm.ENABLE_ASSET_LISTING_CACHE = (os.getenv("OMNIGIBSON_ENABLE_ASSET_LISTING_CACHE", 'False').lower() in ('true', '1', 't'))
+
 # Whether to print out disclaimers (i.e.: known failure cases resulting from Omniverse's current bugs / limitations)
 gm.SHOW_DISCLAIMERS = False
 
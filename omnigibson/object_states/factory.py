@@ -1,40 +1,45 @@
 import networkx as nx
 from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 
 from omnigibson.object_states.kinematics_mixin import KinematicsMixin
 from omnigibson.object_states import *
 
-# states: list of ObjectBaseState
-# requirements: list of ObjectBaseRequirement
+# states: tuple of ObjectBaseState
+# requirements: tuple of ObjectBaseRequirement
 AbilityDependencies = namedtuple("AbilityDependencies", ("states", "requirements"))
 
-# Maps ability name to list of Object States and / or Ability Requirements that determine
+# Maps ability name to tuple of Object States and / or Ability Requirements that determine
 # whether the given ability can be instantiated for a requested object
 _ABILITY_DEPENDENCIES = {
-    "robot": AbilityDependencies(states=[IsGrasping, ObjectsInFOVOfRobot], requirements=[]),
-    "attachable": AbilityDependencies(states=[AttachedTo], requirements=[]),
-    "particleApplier": AbilityDependencies(states=[ParticleApplier], requirements=[ParticleRequirement]),
-    "particleRemover": AbilityDependencies(states=[ParticleRemover], requirements=[ParticleRequirement]),
-    "particleSource": AbilityDependencies(states=[ParticleSource], requirements=[ParticleRequirement]),
-    "particleSink": AbilityDependencies(states=[ParticleSink], requirements=[ParticleRequirement]),
-    "coldSource": AbilityDependencies(states=[HeatSourceOrSink], requirements=[]),
-    "cookable": AbilityDependencies(states=[Cooked, Burnt], requirements=[]),
-    "coverable": AbilityDependencies(states=[Covered], requirements=[]),
-    "freezable": AbilityDependencies(states=[Frozen], requirements=[]),
-    "heatable": AbilityDependencies(states=[Heated], requirements=[]),
-    "heatSource": AbilityDependencies(states=[HeatSourceOrSink], requirements=[]),
-    "meltable": AbilityDependencies(states=[MaxTemperature], requirements=[]),
-    "mixingTool": AbilityDependencies(states=[], requirements=[]),
-    "openable": AbilityDependencies(states=[Open], requirements=[]),
-    "flammable": AbilityDependencies(states=[OnFire], requirements=[]),
-    "saturable": AbilityDependencies(states=[Saturated], requirements=[]),
-    "sliceable": AbilityDependencies(states=[], requirements=[SliceableRequirement]),
-    "slicer": AbilityDependencies(states=[SlicerActive], requirements=[]),
-    "toggleable": AbilityDependencies(states=[ToggledOn], requirements=[]),
-    "cloth": AbilityDependencies(states=[Folded, Unfolded, Overlaid, Draped], requirements=[]),
-    "fillable": AbilityDependencies(states=[Filled, Contains], requirements=[]),
+    "robot": AbilityDependencies(states=(IsGrasping, ObjectsInFOVOfRobot), requirements=()),
+    "attachable": AbilityDependencies(states=(AttachedTo,), requirements=()),
+    "particleApplier": AbilityDependencies(states=(ParticleApplier,), requirements=(ParticleRequirement,)),
+    "particleRemover": AbilityDependencies(states=(ParticleRemover,), requirements=(ParticleRequirement,)),
+    "particleSource": AbilityDependencies(states=(ParticleSource,), requirements=(ParticleRequirement,)),
+    "particleSink": AbilityDependencies(states=(ParticleSink,), requirements=(ParticleRequirement,)),
+    "coldSource": AbilityDependencies(states=(HeatSourceOrSink,), requirements=()),
+    "cookable": AbilityDependencies(states=(Cooked, Burnt), requirements=()),
+    "coverable": AbilityDependencies(states=(Covered,), requirements=()),
+    "freezable": AbilityDependencies(states=(Frozen,), requirements=()),
+    "heatable": AbilityDependencies(states=(Heated,), requirements=()),
+    "heatSource": AbilityDependencies(states=(HeatSourceOrSink,), requirements=()),
+    "meltable": AbilityDependencies(states=(MaxTemperature,), requirements=()),
+    "mixingTool": AbilityDependencies(states=(), requirements=()),
+    "openable": AbilityDependencies(states=(Open,), requirements=()),
+    "flammable": AbilityDependencies(states=(OnFire,), requirements=()),
+    "saturable": AbilityDependencies(states=(Saturated,), requirements=()),
+    "sliceable": AbilityDependencies(states=(), requirements=(SliceableRequirement,)),
+    "slicer": AbilityDependencies(states=(SlicerActive,), requirements=()),
+    "toggleable": AbilityDependencies(states=(ToggledOn,), requirements=()),
+    "cloth": AbilityDependencies(states=(Folded, Unfolded, Overlaid, Draped), requirements=()),
+    "fillable": AbilityDependencies(states=(Filled, Contains), requirements=()),
 }
 
+# Shared (immutable) dependencies returned for unknown abilities
+_NO_DEPENDENCIES = AbilityDependencies(states=(), requirements=())
+
 _DEFAULT_STATE_SET = frozenset(
     [
         Inside,
@@ -84,13 +89,14 @@ _SYSTEM_STATE_SET = frozenset(
 
 _VISUAL_STATE_SET = frozenset(_FIRE_STATE_SET | _STEAM_STATE_SET | _TEXTURE_CHANGE_STATE_SET)
 
-_TEXTURE_CHANGE_PRIORITY = {
+# Read-only, since it's handed out directly by @get_texture_change_priority
+_TEXTURE_CHANGE_PRIORITY = MappingProxyType({
     Frozen: 4,
     Burnt: 3,
     Cooked: 2,
     Saturated: 1,
     ToggledOn: 0,
-}
+})
 
 def get_system_states():
     return _SYSTEM_STATE_SET
@@ -125,15 +131,11 @@ def get_state_name(state):
 
 
 def get_states_for_ability(ability):
-    if ability not in _ABILITY_DEPENDENCIES:
-        return []
-    return _ABILITY_DEPENDENCIES[ability].states
+    return _ABILITY_DEPENDENCIES.get(ability, _NO_DEPENDENCIES).states
 
 
 def get_requirements_for_ability(ability):
-    if ability not in _ABILITY_DEPENDENCIES:
-        return []
-    return _ABILITY_DEPENDENCIES[ability].requirements
+    return _ABILITY_DEPENDENCIES.get(ability, _NO_DEPENDENCIES).requirements
 
 
 def get_state_dependency_graph(states=None):
@@ -143,11 +145,11 @@ def get_state_dependency_graph(states=None):
             over all states
 
     Returns:
-        nx.DiGraph: State dependency graph of supported object states
+        nx.DiGraph: State dependency graph of supported object states. This is a fresh copy of the cached graph, so
+            it can be freely modified
     """
     states = REGISTERED_OBJECT_STATES.values() if states is None else states
-    dependencies = {state: set.union(state.get_dependencies(), state.get_optional_dependencies()) for state in states}
-    return nx.DiGraph(dependencies)
+    return _get_state_dependency_graph(frozenset(states)).copy()
 
 
 def get_states_by_dependency_order(states=None):
@@ -157,6 +159,46 @@ def get_states_by_dependency_order(states=None):
             over all states
 
     Returns:
-        list: all states in topological order of dependency
+        tuple: all states in topological order of dependency. This is shared across calls, so it is immutable
+    """
+    states = REGISTERED_OBJECT_STATES.values() if states is None else states
+    return _get_states_by_dependency_order(frozenset(states))
+
+
+# The requested state sets are determined by the objects' abilities, so only a small number of distinct sets is ever
+# requested in practice. Bound the caches anyway so that unusual usage cannot grow them indefinitely
+_STATE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_STATE_CACHE_SIZE)
+def _get_state_dependency_graph(states):
+    """
+    Cached helper for @get_state_dependency_graph. The returned graph is shared, so it should not be modified
+    in-place.
+
+    Args:
+        states (frozenset): State(s) to generate the dependency graph over
+
+    Returns:
+        nx.DiGraph: State dependency graph of the requested object states
+    """
+    # Insert the states in a fixed order so that the resulting topological order does not depend on set ordering
+    dependencies = {
+        state: set.union(state.get_dependencies(), state.get_optional_dependencies())
+        for state in sorted(states, key=lambda state: state.__name__)
+    }
+    return nx.DiGraph(dependencies)
+
+
+@lru_cache(maxsize=_STATE_CACHE_SIZE)
+def _get_states_by_dependency_order(states):
+    """
+    Cached helper for @get_states_by_dependency_order.
+
+    Args:
+        states (frozenset): State(s) to sort
+
+    Returns:
+        tuple: all requested states (and their dependencies) in topological order of dependency
     """
-    return list(reversed(list(nx.algorithms.topological_sort(get_state_dependency_graph(states)))))
+    return tuple(reversed(list(nx.algorithms.topological_sort(_get_state_dependency_graph(states)))))
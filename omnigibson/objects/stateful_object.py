@@ -412,9 +412,13 @@ class StatefulObject(BaseObject):
         if len(self._visual_states) > 0:
             texture_change_states = []
             emitter_enabled = defaultdict(bool)
+            # These sets are constant, so only fetch them once per update
+            all_texture_change_states = get_texture_change_states()
+            steam_states = get_steam_states()
+            fire_states = get_fire_states()
             for state_type in self._visual_states:
                 state = self.states[state_type]
-                if state_type in get_texture_change_states():
+                if state_type in all_texture_change_states:
                     if state_type == Saturated:
                         for particle_system in ParticleRemover.supported_active_systems.values():
                             if state.get_value(particle_system):
@@ -423,15 +427,16 @@ class StatefulObject(BaseObject):
                                 break
                     elif state.get_value():
                         texture_change_states.append(state)
-                if state_type in get_steam_states():
+                if state_type in steam_states:
                     emitter_enabled[EmitterType.STEAM] |= state.get_value()
-                if state_type in get_fire_states():
+                if state_type in fire_states:
                     emitter_enabled[EmitterType.FIRE] |= state.get_value()
 
             for emitter_type in emitter_enabled:
                 self.set_emitter_enabled(emitter_type, emitter_enabled[emitter_type])
 
-            texture_change_states.sort(key=lambda s: get_texture_change_priority()[s.__class__])
+            texture_change_priority = get_texture_change_priority()
+            texture_change_states.sort(key=lambda s: texture_change_priority[s.__class__])
             object_state = texture_change_states[-1] if len(texture_change_states) > 0 else None
 
             # Only update our texture change if it's a different object state than the one we already have
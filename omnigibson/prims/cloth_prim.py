@@ -559,7 +559,7 @@ class ClothPrim(GeomPrim):
             [state["particle_group"], state["n_particles"]],
             state["particle_positions"].reshape(-1),
             state["particle_velocities"].reshape(-1),
-        ]).astype(float)
+        ], dtype=float)
 
     def _deserialize(self, state):
         # Run super first
@@ -1477,16 +1477,11 @@ class EntityPrim(XFormPrim):
 
     def _serialize(self, state):
         # We serialize by first flattening the root link state and then iterating over all joints and
-        # adding them to the a flattened array
+        # adding them to the a flattened array. Everything is joined in a single concatenation
         state_flat = [self.root_link.serialize(state=state["root_link"])]
-        if self.n_joints > 0:
-            state_flat.append(
-                np.concatenate(
-                    [prim.serialize(state=state["joints"][prim_name]) for prim_name, prim in self._joints.items()]
-                )
-            )
+        state_flat.extend(prim.serialize(state=state["joints"][prim_name]) for prim_name, prim in self._joints.items())
 
-        return np.concatenate(state_flat).astype(float)
+        return np.concatenate(state_flat, dtype=float)
 
     def _deserialize(self, state):
         # We deserialize by first de-flattening the root link state and then iterating over all joints and
@@ -837,7 +837,7 @@ class JointPrim(BasePrim):
             state["effort"],
             state["target_pos"],
             state["target_vel"],
-        ]).astype(float)
+        ], dtype=float)
 
     def _deserialize(self, state):
         # We deserialize deterministically by knowing the order of values -- pos, vel, effort
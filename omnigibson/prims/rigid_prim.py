@@ -794,7 +794,7 @@ class RigidPrim(XFormPrim):
             state_flat,
             state["lin_vel"],
             state["ang_vel"],
-        ]).astype(float)
+        ], dtype=float)
 
     def _deserialize(self, state):
         # Call supermethod first
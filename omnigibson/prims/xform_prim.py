@@ -1,17 +1,174 @@
 from collections.abc import Iterable
+import math
+from numba import jit
 import numpy as np
 import omnigibson as og
 from omnigibson.macros import gm
 import omnigibson.lazy as lazy
 from omnigibson.prims.prim_base import BasePrim
 from omnigibson.prims.material_prim import MaterialPrim
-from omnigibson.utils.transform_utils import quat2euler
 from omnigibson.utils.usd_utils import PoseAPI
 import omnigibson.utils.transform_utils as T
-from scipy.spatial.transform import Rotation as R
 from omnigibson.macros import gm
 import trimesh.transformations
 
+
+# Default USD time code. pxr can only be imported once the simulator is launched, so this is filled in on first use
+_DEFAULT_TIMECODE = None
+
+
+def _default_timecode():
+    """
+    Returns:
+        Usd.TimeCode: The default USD time code, created once and reused afterwards
+    """
+    global _DEFAULT_TIMECODE
+    if _DEFAULT_TIMECODE is None:
+        _DEFAULT_TIMECODE = lazy.pxr.Usd.TimeCode.Default()
+    return _DEFAULT_TIMECODE
+
+
+def _quat_to_euler_xyz(quat):
+    """
+    Converts a single quaternion to extrinsic xyz euler angles (same convention as T.quat2euler), computed directly
+    from the quaternion components without building an intermediate rotation matrix
+
+    Args:
+        quat (4-array): (x,y,z,w) quaternion
+
+    Returns:
+        np.ndarray: (roll, pitch, yaw) euler angles in radians
+    """
+    x, y, z, w = (float(val) for val in quat)
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    # Clamp to guard against numerical drift outside of asin's domain
+    pitch = math.asin(min(1.0, max(-1.0, 2.0 * (w * y - z * x))))
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return np.array((roll, pitch, yaw))
+
+
+def _quat_to_mat3(quat):
+    """
+    Converts a single quaternion to a 3x3 rotation matrix using scalar math, which avoids scipy's Rotation overhead
+    for a single quaternion. The quaternion does not need to be normalized
+
+    Args:
+        quat (4-array): (x,y,z,w) quaternion
+
+    Returns:
+        np.ndarray: (3, 3) rotation matrix
+    """
+    x, y, z, w = (float(val) for val in quat)
+    s = 2.0 / (x * x + y * y + z * z + w * w)
+    xs, ys, zs = x * s, y * s, z * s
+    wx, wy, wz = w * xs, w * ys, w * zs
+    xx, xy, xz = x * xs, x * ys, x * zs
+    yy, yz, zz = y * ys, y * zs, z * zs
+    return np.array((
+        (1.0 - (yy + zz), xy - wz, xz + wy),
+        (xy + wz, 1.0 - (xx + zz), yz - wx),
+        (xz - wy, yz + wx, 1.0 - (xx + yy)),
+    ))
+
+
+@jit(nopython=True, cache=True)
+def _world_to_local_pose(parent_tf, position, orientation):
+    """
+    Converts a world frame pose into the local frame of a parent whose (possibly scaled) world transform is
+    @parent_tf. The parent transform is decomposed into translation t, rotation R and per-axis scale S and inverted
+    in closed form:
+
+        local_pos = S^-1 R^T (pos - t)
+        local_orn = q_parent^-1 * orn
+
+    If the parent transform contains a reflection (negative determinant), the reflection is folded into the x scale
+    so that R stays a proper rotation.
+
+    Args:
+        parent_tf (np.ndarray): (4, 4) parent world transform, including scale
+        position (np.ndarray): (x,y,z) world frame position
+        orientation (np.ndarray): (x,y,z,w) world frame quaternion orientation
+
+    Returns:
+        2-tuple:
+            - np.ndarray: (x,y,z) position in the parent frame
+            - np.ndarray: (x,y,z,w) quaternion orientation in the parent frame
+    """
+    rot = np.empty((3, 3))
+    scale = np.empty(3)
+    for j in range(3):
+        scale[j] = np.sqrt(parent_tf[0, j] ** 2 + parent_tf[1, j] ** 2 + parent_tf[2, j] ** 2)
+        for i in range(3):
+            rot[i, j] = parent_tf[i, j] / scale[j]
+
+    det = (
+        rot[0, 0] * (rot[1, 1] * rot[2, 2] - rot[1, 2] * rot[2, 1])
+        - rot[0, 1] * (rot[1, 0] * rot[2, 2] - rot[1, 2] * rot[2, 0])
+        + rot[0, 2] * (rot[1, 0] * rot[2, 1] - rot[1, 1] * rot[2, 0])
+    )
+    if det < 0.0:
+        scale[0] = -scale[0]
+        for i in range(3):
+            rot[i, 0] = -rot[i, 0]
+
+    local_pos = np.empty(3)
+    for j in range(3):
+        local_pos[j] = (
+            rot[0, j] * (position[0] - parent_tf[0, 3])
+            + rot[1, j] * (position[1] - parent_tf[1, 3])
+            + rot[2, j] * (position[2] - parent_tf[2, 3])
+        ) / scale[j]
+
+    # Rotation matrix -> quaternion, branching on the largest diagonal term for numerical stability
+    trace = rot[0, 0] + rot[1, 1] + rot[2, 2]
+    if trace > 0.0:
+        s = 2.0 * np.sqrt(trace + 1.0)
+        pw, px, py, pz = 0.25 * s, (rot[2, 1] - rot[1, 2]) / s, (rot[0, 2] - rot[2, 0]) / s, (rot[1, 0] - rot[0, 1]) / s
+    elif rot[0, 0] > rot[1, 1] and rot[0, 0] > rot[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + rot[0, 0] - rot[1, 1] - rot[2, 2])
+        pw, px, py, pz = (rot[2, 1] - rot[1, 2]) / s, 0.25 * s, (rot[0, 1] + rot[1, 0]) / s, (rot[0, 2] + rot[2, 0]) / s
+    elif rot[1, 1] > rot[2, 2]:
+        s = 2.0 * np.sqrt(1.0 + rot[1, 1] - rot[0, 0] - rot[2, 2])
+        pw, px, py, pz = (rot[0, 2] - rot[2, 0]) / s, (rot[0, 1] + rot[1, 0]) / s, 0.25 * s, (rot[1, 2] + rot[2, 1]) / s
+    else:
+        s = 2.0 * np.sqrt(1.0 + rot[2, 2] - rot[0, 0] - rot[1, 1])
+        pw, px, py, pz = (rot[1, 0] - rot[0, 1]) / s, (rot[0, 2] + rot[2, 0]) / s, (rot[1, 2] + rot[2, 1]) / s, 0.25 * s
+
+    # conjugate(q_parent) * orn
+    x, y, z, w = orientation[0], orientation[1], orientation[2], orientation[3]
+    local_orn = np.empty(4)
+    local_orn[0] = pw * x - px * w - py * z + pz * y
+    local_orn[1] = pw * y + px * z - py * w - pz * x
+    local_orn[2] = pw * z - px * y + py * x - pz * w
+    local_orn[3] = pw * w + px * x + py * y + pz * z
+    local_orn /= np.sqrt(local_orn[0] ** 2 + local_orn[1] ** 2 + local_orn[2] ** 2 + local_orn[3] ** 2)
+
+    return local_pos, local_orn
+
+
+@jit(nopython=True, cache=True)
+def _world_to_local_poses(parent_tfs, positions, orientations):
+    """
+    Batched version of @_world_to_local_pose
+
+    Args:
+        parent_tfs (np.ndarray): (N, 4, 4) parent world transforms, including scale
+        positions (np.ndarray): (N, 3) world frame positions
+        orientations (np.ndarray): (N, 4) world frame (x,y,z,w) quaternion orientations
+
+    Returns:
+        2-tuple:
+            - np.ndarray: (N, 3) positions in the parent frames
+            - np.ndarray: (N, 4) (x,y,z,w) quaternion orientations in the parent frames
+    """
+    n = positions.shape[0]
+    local_pos = np.empty((n, 3))
+    local_orn = np.empty((n, 4))
+    for i in range(n):
+        local_pos[i], local_orn[i] = _world_to_local_pose(parent_tfs[i], positions[i], orientations[i])
+    return local_pos, local_orn
+
+
 class XFormPrim(BasePrim):
     """
     Provides high level functions to deal with an Xform prim and its attributes/ properties.
@@ -40,8 +197,17 @@ class XFormPrim(BasePrim):
         # Other values that will be filled in at runtime
         self._binding_api = None
         self._material = None
+        self._has_material = None       # Cached result of has_material(), updated whenever we bind a material
         self._collision_filter_api = None
         self.original_scale = None
+        self._scale = None      # Cached local scale, so that we don't need to query USD every time
+        # Cached xformOp attribute handles, so that pose / scale setters don't need to look them up by name every time
+        self._translate_attr = None
+        self._orient_attr = None
+        self._scale_attr = None
+        self._orient_is_float = None    # Whether xformOp:orient is authored as quatf (vs. quatd)
+        self._xformable = None
+        self._parent_prim_path = None   # Cached parent prim path, refreshed if this prim is ever moved
 
         # Run super method
         super().__init__(
@@ -57,6 +223,9 @@ class XFormPrim(BasePrim):
         # run super first
         super()._post_load()
 
+        # Cache the parent prim path, which is needed every time we set this prim's world pose
+        self._parent_prim_path = str(lazy.omni.isaac.core.utils.prims.get_prim_parent(self._prim).GetPath())
+
         # Make sure all xforms have pose and scaling info
         self._set_xform_properties()
 
@@ -85,6 +254,22 @@ class XFormPrim(BasePrim):
         if "scale" in self._load_config and self._load_config["scale"] is not None:
             self.scale = self._load_config["scale"]
 
+    def change_prim_path(self, new_prim_path):
+        # Run super first
+        super().change_prim_path(new_prim_path=new_prim_path)
+
+        # Our cached USD handles refer to the prim at its old path, so refresh them
+        if self._parent_prim_path is not None:
+            self._parent_prim_path = str(lazy.omni.isaac.core.utils.prims.get_prim_parent(self._prim).GetPath())
+        if self._xformable is not None:
+            self._xformable = lazy.pxr.UsdGeom.Xformable(self._prim)
+        if self._translate_attr is not None:
+            self._cache_xform_ops(
+                xform_op_translate=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:translate")),
+                xform_op_rot=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:orient")),
+                xform_op_scale=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:scale")),
+            )
+
     def remove(self):
         # Remove the material prim if one exists
         if self._material is not None:
@@ -94,7 +279,6 @@ class XFormPrim(BasePrim):
         super().remove()
 
     def _set_xform_properties(self):
-        current_position, current_orientation = self.get_position_orientation()
         properties_to_remove = [
             "xformOp:rotateX",
             "xformOp:rotateXZY",
@@ -107,8 +291,26 @@ class XFormPrim(BasePrim):
             "xformOp:rotateXYZ",
             "xformOp:transform",
         ]
+        canonical_op_order = ["xformOp:translate", "xformOp:orient", "xformOp:scale"]
         prop_names = self.prim.GetPropertyNames()
         xformable = lazy.pxr.UsdGeom.Xformable(self.prim)
+        self._xformable = xformable
+
+        # If the prim already has exactly translate / orient / scale ops in canonical order, there is nothing to
+        # re-author. Skip clearing and re-setting the ops, which would otherwise trigger needless USD change
+        # notifications for every prim at load time
+        op_order = xformable.GetXformOpOrderAttr().Get()
+        if op_order is not None and [str(op) for op in op_order] == canonical_op_order and \
+                all(prop_name in prop_names for prop_name in canonical_op_order) and \
+                not any(prop_name in properties_to_remove for prop_name in prop_names):
+            self._cache_xform_ops(
+                xform_op_translate=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:translate")),
+                xform_op_rot=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:orient")),
+                xform_op_scale=lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:scale")),
+            )
+            return
+
+        current_position, current_orientation = self.get_position_orientation()
         xformable.ClearXformOpOrder()
         # TODO: wont be able to delete props for non root links on articulated objects
         for prop_name in prop_names:
@@ -132,23 +334,48 @@ class XFormPrim(BasePrim):
         else:
             xform_op_rot = lazy.pxr.UsdGeom.XformOp(self._prim.GetAttribute("xformOp:orient"))
         xformable.SetXformOpOrder([xform_op_translate, xform_op_rot, xform_op_scale])
+        self._cache_xform_ops(
+            xform_op_translate=xform_op_translate,
+            xform_op_rot=xform_op_rot,
+            xform_op_scale=xform_op_scale,
+        )
 
         self.set_position_orientation(position=current_position, orientation=current_orientation)
-        new_position, new_orientation = self.get_position_orientation()
-        r1 = R.from_quat(current_orientation).as_matrix()
-        r2 = R.from_quat(new_orientation).as_matrix()
-        # Make sure setting is done correctly
-        assert np.allclose(new_position, current_position, atol=1e-4) and np.allclose(r1, r2, atol=1e-4), \
-            f"{self.prim_path}: old_pos: {current_position}, new_pos: {new_position}, " \
-            f"old_orn: {current_orientation}, new_orn: {new_orientation}"
+        if gm.DEBUG:
+            # Make sure setting is done correctly. This requires an additional world pose query, so we only verify
+            # when debugging
+            new_position, new_orientation = self.get_position_orientation()
+            r1 = _quat_to_mat3(current_orientation)
+            r2 = _quat_to_mat3(new_orientation)
+            assert np.allclose(new_position, current_position, atol=1e-4) and np.allclose(r1, r2, atol=1e-4), \
+                f"{self.prim_path}: old_pos: {current_position}, new_pos: {new_position}, " \
+                f"old_orn: {current_orientation}, new_orn: {new_orientation}"
+
+    def _cache_xform_ops(self, xform_op_translate, xform_op_rot, xform_op_scale):
+        """
+        Caches the attribute handles of this prim's translate / orient / scale xform ops
+
+        Args:
+            xform_op_translate (UsdGeom.XformOp): translate op
+            xform_op_rot (UsdGeom.XformOp): orient op
+            xform_op_scale (UsdGeom.XformOp): scale op
+        """
+        self._translate_attr = xform_op_translate.GetAttr()
+        self._orient_attr = xform_op_rot.GetAttr()
+        self._scale_attr = xform_op_scale.GetAttr()
+        self._orient_is_float = self._orient_attr.GetTypeName() == "quatf"
+        # The scale op may have just been (re-)authored, so clear our cached value
+        self._scale = None
 
     def has_material(self):
         """
         Returns:
             bool: True if there is a visual material bound to this prim. False otherwise
         """
-        material_path = self._binding_api.GetDirectBinding().GetMaterialPath().pathString
-        return False if material_path == "" else True
+        if self._has_material is None:
+            material_path = self._binding_api.GetDirectBinding().GetMaterialPath().pathString
+            self._has_material = material_path != ""
+        return self._has_material
 
     def set_position_orientation(self, position=None, orientation=None):
         """
@@ -160,21 +387,29 @@ class XFormPrim(BasePrim):
             orientation (None or 4-array): if specified, (x,y,z,w) quaternion orientation in the world frame.
                 Default is None, which means left unchanged.
         """
-        current_position, current_orientation = self.get_position_orientation()
-        
-        position = current_position if position is None else np.array(position, dtype=float)
-        orientation = current_orientation if orientation is None else np.array(orientation, dtype=float)
+        # Only query the current pose if we actually need it
+        if position is None or orientation is None:
+            current_position, current_orientation = self.get_position_orientation()
+            position = current_position if position is None else position
+            orientation = current_orientation if orientation is None else orientation
+
+        position = np.array(position, dtype=float)
+        orientation = np.array(orientation, dtype=float)
         assert np.isclose(np.linalg.norm(orientation), 1, atol=1e-3), \
             f"{self.prim_path} desired orientation {orientation} is not a unit quaternion."
 
-        my_world_transform = T.pose2mat((position, orientation))
-
-        parent_prim = lazy.omni.isaac.core.utils.prims.get_prim_parent(self._prim)
-        parent_path = str(parent_prim.GetPath())
-        parent_world_transform = PoseAPI.get_world_pose_with_scale(parent_path)
+        local_pos, local_orn = _world_to_local_pose(self._get_parent_world_transform(), position, orientation)
+        self.set_local_pose(local_pos, local_orn)
 
-        local_transform = np.linalg.inv(parent_world_transform) @ my_world_transform
-        self.set_local_pose(*T.mat2pose(local_transform))
+    def _get_parent_world_transform(self):
+        """
+        Returns:
+            np.ndarray: (4, 4) world transform of this prim's parent, including scale
+        """
+        parent_path = self._parent_prim_path
+        if parent_path is None:
+            parent_path = str(lazy.omni.isaac.core.utils.prims.get_prim_parent(self._prim).GetPath())
+        return PoseAPI.get_world_pose_with_scale(parent_path)
 
     def get_position_orientation(self):
         """
@@ -187,6 +422,50 @@ class XFormPrim(BasePrim):
         """
         return PoseAPI.get_world_pose(self._prim_path)
 
+    @staticmethod
+    def set_positions_orientations(prims, positions, orientations):
+        """
+        Batched version of @set_position_orientation. Poses of plain XFormPrims are converted into their parents'
+        frames with a single kernel call and written in a single USD change block. Any other prims (e.g. RigidPrim or
+        EntityPrim, which route poses through physics) are set one at a time through their own
+        @set_position_orientation.
+
+        Note that all parent transforms are read before any pose is written, so @prims should not contain each
+        other's ancestors.
+
+        Args:
+            prims (list of XFormPrim): prims whose poses should be set
+            positions ((N, 3)-array): (x,y,z) positions in the world frame, one per prim
+            orientations ((N, 4)-array): (x,y,z,w) quaternion orientations in the world frame, one per prim
+        """
+        positions = np.array(positions, dtype=float).reshape(-1, 3)
+        orientations = np.array(orientations, dtype=float).reshape(-1, 4)
+        assert len(prims) == len(positions) == len(orientations), \
+            "Got mismatched number of prims, positions, and orientations!"
+        assert np.allclose(np.linalg.norm(orientations, axis=-1), 1, atol=1e-3), \
+            "Desired orientations must all be unit quaternions."
+
+        batched_idxs = []
+        for i, prim in enumerate(prims):
+            if type(prim).set_position_orientation is XFormPrim.set_position_orientation and \
+                    type(prim).set_local_pose is XFormPrim.set_local_pose:
+                batched_idxs.append(i)
+            else:
+                prim.set_position_orientation(positions[i], orientations[i])
+        if len(batched_idxs) == 0:
+            return
+
+        batched_prims = [prims[i] for i in batched_idxs]
+        parent_tfs = np.stack([prim._get_parent_world_transform() for prim in batched_prims])
+        local_pos, local_orn = _world_to_local_poses(parent_tfs, positions[batched_idxs], orientations[batched_idxs])
+        with lazy.pxr.Sdf.ChangeBlock():
+            for prim, pos, orn in zip(batched_prims, local_pos, local_orn):
+                prim._write_local_pose(pos, orn)
+        PoseAPI.invalidate()
+        if gm.ENABLE_FLATCACHE:
+            for prim in batched_prims:
+                prim._sync_fabric_local_pose()
+
     def set_position(self, position):
         """
         Set this prim's position with respect to the world frame
@@ -230,14 +509,15 @@ class XFormPrim(BasePrim):
         Returns:
             3-array: (roll, pitch, yaw) global euler orientation of this prim
         """
-        return quat2euler(self.get_orientation())
+        return _quat_to_euler_xyz(self.get_orientation())
     
     def get_2d_orientation(self):
         """
         Get this prim's orientation on the XY plane of the world frame. This is obtained by
         projecting the forward vector onto the XY plane and then computing the angle.
         """
-        fwd = R.from_quat(self.get_orientation()).apply([1, 0, 0])
+        # The forward vector is the first column of the rotation matrix
+        fwd = _quat_to_mat3(self.get_orientation())[:, 0]
         fwd[2] = 0.
 
         # If the object is facing close to straight up, then we can't compute a 2D orientation
@@ -258,7 +538,8 @@ class XFormPrim(BasePrim):
                 - 4-array: (x,y,z,w) quaternion orientation in the local frame
         """
         pos, ori = lazy.omni.isaac.core.utils.xforms.get_local_pose(self.prim_path)
-        return pos, ori[[1, 2, 3, 0]]
+        # (w,x,y,z) -> (x,y,z,w); explicit packing avoids a fancy-indexing copy per call
+        return pos, np.array((ori[1], ori[2], ori[3], ori[0]))
 
     def set_local_pose(self, position=None, orientation=None):
         """
@@ -269,36 +550,70 @@ class XFormPrim(BasePrim):
                 (with respect to its parent prim). Default is None, which means left unchanged.
             orientation (None or 4-array): if specified, (x,y,z,w) quaternion orientation in the local frame of the prim
                 (with respect to its parent prim). Default is None, which means left unchanged.
-        """            
-        properties = self.prim.GetPropertyNames()
+        """
+        self._write_local_pose(position, orientation)
+        PoseAPI.invalidate()
+        if gm.ENABLE_FLATCACHE:
+            self._sync_fabric_local_pose()
+
+    def _write_local_pose(self, position=None, orientation=None):
+        """
+        Writes the local pose xformOps of this prim to USD, without invalidating the PoseAPI or syncing fabric
+
+        Args:
+            position (None or 3-array): if specified, (x,y,z) position in the local frame of the prim
+            orientation (None or 4-array): if specified, (x,y,z,w) quaternion orientation in the local frame of the prim
+        """
         if position is not None:
             position = lazy.pxr.Gf.Vec3d(*np.array(position, dtype=float))
-            if "xformOp:translate" not in properties:
-                lazy.carb.log_error(
-                    "Translate property needs to be set for {} before setting its position".format(self.name)
-                )
-            self.set_attribute("xformOp:translate", position)
+            if self._translate_attr is None:
+                if not self._prim.HasAttribute("xformOp:translate"):
+                    lazy.carb.log_error(
+                        "Translate property needs to be set for {} before setting its position".format(self.name)
+                    )
+                self.set_attribute("xformOp:translate", position)
+            else:
+                self._translate_attr.Set(position)
         if orientation is not None:
-            orientation = np.array(orientation, dtype=float)[[3, 0, 1, 2]]
-            if "xformOp:orient" not in properties:
-                lazy.carb.log_error(
-                    "Orient property needs to be set for {} before setting its orientation".format(self.name)
-                )
-            xform_op = self._prim.GetAttribute("xformOp:orient")
-            if xform_op.GetTypeName() == "quatf":
-                rotq = lazy.pxr.Gf.Quatf(*orientation)
+            qx, qy, qz, qw = (float(val) for val in orientation)
+            xform_op, is_float = self._orient_attr, self._orient_is_float
+            if xform_op is None:
+                if not self._prim.HasAttribute("xformOp:orient"):
+                    lazy.carb.log_error(
+                        "Orient property needs to be set for {} before setting its orientation".format(self.name)
+                    )
+                xform_op = self._prim.GetAttribute("xformOp:orient")
+                is_float = xform_op.GetTypeName() == "quatf"
+            if is_float:
+                rotq = lazy.pxr.Gf.Quatf(qw, qx, qy, qz)
             else:
-                rotq = lazy.pxr.Gf.Quatd(*orientation)
+                rotq = lazy.pxr.Gf.Quatd(qw, qx, qy, qz)
             xform_op.Set(rotq)
-        PoseAPI.invalidate()
-        if gm.ENABLE_FLATCACHE:
-            # If flatcache is on, make sure the USD local pose is synced to the fabric local pose.
-            # Ideally we should call usdrt's set local pose directly, but there is no such API.
-            # The only available API is SetLocalXformFromUsd, so we update USD first, and then sync to fabric.
-            xformable_prim = lazy.usdrt.Rt.Xformable(lazy.omni.isaac.core.utils.prims.get_prim_at_path(self.prim_path, fabric=True))
-            assert not xformable_prim.HasWorldXform(), "Fabric's world pose is set for a non-rigid prim which is unexpected. Please report this."
-            xformable_prim.SetLocalXformFromUsd()
-        return
+
+    def _sync_fabric_local_pose(self):
+        """
+        Syncs this prim's USD local pose to fabric. Only needed when flatcache is enabled
+        """
+        # If flatcache is on, make sure the USD local pose is synced to the fabric local pose.
+        # Ideally we should call usdrt's set local pose directly, but there is no such API.
+        # The only available API is SetLocalXformFromUsd, so we update USD first, and then sync to fabric.
+        xformable_prim = lazy.usdrt.Rt.Xformable(lazy.omni.isaac.core.utils.prims.get_prim_at_path(self.prim_path, fabric=True))
+        assert not xformable_prim.HasWorldXform(), "Fabric's world pose is set for a non-rigid prim which is unexpected. Please report this."
+        xformable_prim.SetLocalXformFromUsd()
+
+    @property
+    def aabb_center_extent(self):
+        """
+        Get this xform's bounding box center and extent, computing the bounding box only once. This relies on the
+        subclass' @aabb property
+
+        Returns:
+            2-tuple:
+                - 3-array: (x,y,z) bounding box center
+                - 3-array: (x,y,z) bounding box extent
+        """
+        min_corner, max_corner = self.aabb
+        return (max_corner + min_corner) / 2.0, max_corner - min_corner
 
     def get_world_scale(self):
         """
@@ -307,7 +622,8 @@ class XFormPrim(BasePrim):
         Returns:
             np.ndarray: scale applied to the prim's dimensions in the world frame. shape is (3, ).
         """
-        prim_tf = lazy.pxr.UsdGeom.Xformable(self._prim).ComputeLocalToWorldTransform(lazy.pxr.Usd.TimeCode.Default())
+        xformable = lazy.pxr.UsdGeom.Xformable(self._prim) if self._xformable is None else self._xformable
+        prim_tf = xformable.ComputeLocalToWorldTransform(_default_timecode())
         transform = lazy.pxr.Gf.Transform()
         transform.SetMatrix(prim_tf)
         return np.array(transform.GetScale())
@@ -330,7 +646,9 @@ class XFormPrim(BasePrim):
         Returns:
             np.ndarray: scale applied to the prim's dimensions in the local frame. shape is (3, ).
         """
-        return np.array(self.get_attribute("xformOp:scale"))
+        if self._scale is None:
+            self._scale = np.array(self.get_attribute("xformOp:scale"))
+        return self._scale.copy()
 
     @scale.setter
     def scale(self, scale):
@@ -341,12 +659,24 @@ class XFormPrim(BasePrim):
             scale (float or np.ndarray): scale to be applied to the prim's dimensions. shape is (3, ).
                                           Defaults to None, which means left unchanged.
         """
-        scale = np.array(scale, dtype=float) if isinstance(scale, Iterable) else np.ones(3) * scale
-        scale = lazy.pxr.Gf.Vec3d(*scale)
-        properties = self.prim.GetPropertyNames()
-        if "xformOp:scale" not in properties:
-            lazy.carb.log_error("Scale property needs to be set for {} before setting its scale".format(self.name))
-        self.set_attribute("xformOp:scale", scale)
+        if isinstance(scale, Iterable):
+            sx, sy, sz = (float(val) for val in scale)
+        else:
+            sx = sy = sz = float(scale)
+        scale = lazy.pxr.Gf.Vec3d(sx, sy, sz)
+        if self._scale_attr is None:
+            if not self._prim.HasAttribute("xformOp:scale"):
+                lazy.carb.log_error("Scale property needs to be set for {} before setting its scale".format(self.name))
+            self.set_attribute("xformOp:scale", scale)
+        else:
+            self._scale_attr.Set(scale)
+        self._scale = np.array((sx, sy, sz))
+
+    def set_attribute(self, attr, val):
+        # Invalidate our cached scale if it's being directly modified
+        if attr == "xformOp:scale":
+            self._scale = None
+        super().set_attribute(attr=attr, val=val)
 
     @property
     def material(self):
@@ -366,6 +696,7 @@ class XFormPrim(BasePrim):
         """
         self._binding_api.Bind(lazy.pxr.UsdShade.Material(material.prim), bindingStrength=lazy.pxr.UsdShade.Tokens.weakerThanDescendants)
         self._material = material
+        self._has_material = True
 
     def add_filtered_collision_pair(self, prim):
         """
@@ -397,7 +728,10 @@ class XFormPrim(BasePrim):
         self.set_position_orientation(np.array(state["pos"]), np.array(state["ori"]))
 
     def _serialize(self, state):
-        return np.concatenate([state["pos"], state["ori"]]).astype(float)
+        state_flat = np.empty(7)
+        state_flat[0:3] = state["pos"]
+        state_flat[3:7] = state["ori"]
+        return state_flat
 
     def _deserialize(self, state):
         # We deserialize deterministically by knowing the order of values -- pos, ori
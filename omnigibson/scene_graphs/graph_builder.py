@@ -15,7 +15,8 @@ from omnigibson.utils import transform_utils as T
 
 
 def _formatted_aabb(obj):
-    return T.pose2mat((obj.aabb_center, [0, 0, 0, 1])), obj.aabb_extent
+    aabb_center, aabb_extent = obj.aabb_center_extent
+    return T.pose2mat((aabb_center, [0, 0, 0, 1])), aabb_extent
 
 
 class SceneGraphBuilder(object):
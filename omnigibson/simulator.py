@@ -761,26 +761,29 @@ def launch_simulator(*args, **kwargs):
             assert n_physics_timesteps_per_render.is_integer(), "render_timestep must be a multiple of physics_timestep"
             return int(n_physics_timesteps_per_render)
 
-        def step(self, render=True):
+        def step(self, render=True, n_steps=1):
             """
             Step the simulation at self.render_timestep
 
             Args:
                 render (bool): Whether rendering should occur or not
+                n_steps (int): Number of consecutive simulation steps to take. Each one is a full render timestep,
+                    so this is equivalent to calling step() @n_steps times
             """
-            # If we have imported any objects within the last timestep, we render the app once, since otherwise calling
-            # step() may not step physics
-            if len(self._objects_to_initialize) > 0:
-                self.render()
+            for _ in range(n_steps):
+                # If we have imported any objects within the last timestep, we render the app once, since otherwise
+                # calling step() may not step physics
+                if len(self._objects_to_initialize) > 0:
+                    self.render()
 
-            if render:
-                super().step(render=True)
-            else:
-                for i in range(self.n_physics_timesteps_per_render):
-                    super().step(render=False)
+                if render:
+                    super().step(render=True)
+                else:
+                    for i in range(self.n_physics_timesteps_per_render):
+                        super().step(render=False)
 
-            # Additionally run non physics things
-            self._non_physics_step()
+                # Additionally run non physics things
+                self._non_physics_step()
 
             # TODO (eric): After stage changes (e.g. pose, texture change), it will take two super().step(render=True) for
             #  the result to propagate to the rendering. We could have called super().render() here but it will introduce
@@ -792,7 +792,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         is_cloth = cls._is_cloth_obj(obj=parent_obj)
         link_tf = T.pose2mat(XFormPrim.get_local_pose(parent_obj)) if is_cloth else \
             T.pose2mat(cls._particles_info[name]["link"].get_position_orientation())
-        local_mat = np.linalg.inv(link_tf) @ global_mat
+        local_mat = T.pose_inv(link_tf) @ global_mat
 
         cls._modify_particle_local_mat(name=name, mat=local_mat, ignore_scale=False)
 
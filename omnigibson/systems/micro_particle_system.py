@@ -90,11 +90,19 @@ class PhysxParticleInstancer(BasePrim):
         # Store inputs
         self._idn = idn
 
+        # Cached handles to the per-particle attributes, which are read / written frequently
+        self._particle_attrs = dict()
+
         # Run super method directly
         super().__init__(prim_path=prim_path, name=name)
 
         self._parent_prim = BasePrim(prim_path=self.prim.GetParent().GetPath().pathString, name=f"{name}_parent")
 
+        self._particle_attrs = {
+            attr: self.prim.GetAttribute(attr)
+            for attr in ("positions", "orientations", "velocities", "scales", "protoIndices")
+        }
+
     def _load(self):
         # We raise an error, this should NOT be created from scratch
         raise NotImplementedError("PhysxPointInstancer should NOT be loaded via this class! Should be created before.")
@@ -103,6 +111,19 @@ class PhysxParticleInstancer(BasePrim):
         super().remove()
         self._parent_prim.remove()
 
+    def get_attribute(self, attr):
+        # Use cached attribute handle if we have one to avoid a by-name lookup
+        attr_handle = self._particle_attrs.get(attr, None)
+        return super().get_attribute(attr=attr) if attr_handle is None else attr_handle.Get()
+
+    def set_attribute(self, attr, val):
+        # Use cached attribute handle if we have one to avoid a by-name lookup
+        attr_handle = self._particle_attrs.get(attr, None)
+        if attr_handle is None:
+            super().set_attribute(attr=attr, val=val)
+        else:
+            attr_handle.Set(val)
+
     def add_particles(
             self,
             positions,
@@ -906,25 +906,33 @@ class SlicingRule(BaseTransitionRule):
         for sliceable_obj in object_candidates["sliceable"]:
             # Object parts offset annotation are w.r.t the base link of the whole object.
             pos, orn = sliceable_obj.get_position_orientation()
+            orn_mat = T.quat2mat(orn)
+            sliceable_obj_scale = sliceable_obj.scale
 
-            # Load object parts
-            for i, part in enumerate(sliceable_obj.metadata["object_parts"].values()):
-                # List of dicts gets replaced by {'0':dict, '1':dict, ...}
+            # Propagate non-physical states of the whole object to the half objects, e.g. cooked, saturated, etc.
+            # This is shared by all parts, so only dump it once
+            sliceable_obj_state = sliceable_obj.dump_state()
+
+            # Gather the object parts' bounding box info into arrays so their poses can be computed in one go
+            # List of dicts gets replaced by {'0':dict, '1':dict, ...}
+            parts = list(sliceable_obj.metadata["object_parts"].values())
+            parts_bb_pos = np.array([part["bb_pos"] for part in parts])
+            parts_bb_orn = np.array([part["bb_orn"] for part in parts])
 
-                # Get bounding box info
-                part_bb_pos = np.array(part["bb_pos"])
-                part_bb_orn = np.array(part["bb_orn"])
+            # Determine the relative scale to apply to the object parts from the original object
+            # Note that proper (rotated) scaling can only be applied when the relative orientation of
+            # the object part is a multiple of 90 degrees wrt the parent object, so we assert that here
+            assert all(T.check_quat_right_angle(part_bb_orn) for part_bb_orn in parts_bb_orn), \
+                "Sliceable objects should only have relative object part orientations that are factors of 90 degrees!"
 
-                # Determine the relative scale to apply to the object part from the original object
-                # Note that proper (rotated) scaling can only be applied when the relative orientation of
-                # the object part is a multiple of 90 degrees wrt the parent object, so we assert that here
-                assert T.check_quat_right_angle(part_bb_orn), "Sliceable objects should only have relative object part orientations that are factors of 90 degrees!"
+            # Scale the offsets accordingly.
+            parts_scale = np.abs(T.quat2mat(parts_bb_orn) @ sliceable_obj_scale)
 
-                # Scale the offset accordingly.
-                scale = np.abs(T.quat2mat(part_bb_orn) @ sliceable_obj.scale)
+            # Calculate global part bounding box positions.
+            parts_bb_pos = pos + (parts_bb_pos * parts_scale) @ orn_mat.T
 
-                # Calculate global part bounding box pose.
-                part_bb_pos = pos + T.quat2mat(orn) @ (part_bb_pos * scale)
+            # Load object parts
+            for i, (part, part_bb_pos, part_bb_orn, scale) in enumerate(zip(parts, parts_bb_pos, parts_bb_orn, parts_scale)):
                 part_bb_orn = T.quat_multiply(orn, part_bb_orn)
                 part_obj_name = f"half_{sliceable_obj.name}_{i}"
                 part_obj = DatasetObject(
@@ -934,14 +942,12 @@ class SlicingRule(BaseTransitionRule):
                     bounding_box=part["bb_size"] * scale,   # equiv. to scale=(part["bb_size"] / self.native_bbox) * (scale)
                 )
 
-                sliceable_obj_state = sliceable_obj.dump_state()
-                # Propagate non-physical states of the whole object to the half objects, e.g. cooked, saturated, etc.
                 # Add the new object to the results.
                 new_obj_attrs = ObjectAttrs(
                     obj=part_obj,
                     bb_pos=part_bb_pos,
                     bb_orn=part_bb_orn,
-                    callback=lambda obj: obj.load_non_kin_state(sliceable_obj_state),
+                    callback=lambda obj, state=sliceable_obj_state: obj.load_non_kin_state(state),
                 )
                 objs_to_add.append(new_obj_attrs)
 
@@ -1712,7 +1718,10 @@ class RecipeRule(BaseTransitionRule):
             # TODO: What to do if setter fails?
             if not obj.states[state].set_value(container, True):
                 log.warning(f"Failed to spawn object {obj.name} in container {container.name}! Directly placing on top instead.")
-                pos = np.array(container.aabb_center) + np.array([0, 0, container.aabb_extent[2] / 2.0 + obj.aabb_extent[2] / 2.0])
+                container_aabb_center, container_aabb_extent = container.aabb_center_extent
+                _, obj_aabb_extent = obj.aabb_center_extent
+                pos = container_aabb_center + \
+                    np.array([0, 0, (container_aabb_extent[2] + obj_aabb_extent[2]) / 2.0])
                 obj.set_bbox_center_position_orientation(position=pos)
 
         # Spawn in new objects
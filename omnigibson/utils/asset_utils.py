@@ -1,19 +1,31 @@
 import argparse
 import json
 import os
+import mmap
+import re
 import subprocess
-import tempfile
+import tarfile
 import contextlib
 import inspect
 from copy import deepcopy
+from functools import cache
 from pathlib import Path
-from cryptography.fernet import Fernet
-from collections import defaultdict
-from urllib.request import urlretrieve
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen, urlretrieve
 import yaml
 import progressbar
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 import omnigibson as og
-from omnigibson.macros import gm
+from omnigibson.macros import gm, create_module_macros
 from omnigibson.utils.ui_utils import create_module_logger
 if os.getenv("OMNIGIBSON_NO_OMNIVERSE", default=0) != "1":
     import omnigibson.lazy as lazy
@@ -21,6 +33,12 @@ if os.getenv("OMNIGIBSON_NO_OMNIVERSE", default=0) != "1":
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Maximum number of model assets decrypted ahead of time when checking model abilities
+m.MAX_DECRYPT_WORKERS = 4
+
 pbar = None
 
 def show_progress(block_num, block_size, total_size):
@@ -36,6 +54,87 @@ def show_progress(block_num, block_size, total_size):
         pbar.finish()
         pbar = None
 
+class _ProgressReader:
+    """
+    Thin wrapper around a readable binary stream @stream that reports read progress via show_progress()
+    """
+    def __init__(self, stream, total_size):
+        self._stream = stream
+        self._total_size = total_size
+        self._n_read = 0
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        if self._total_size > 0:
+            self._n_read += len(data)
+            show_progress(self._n_read, 1, self._total_size)
+        return data
+
+
+def download_and_extract(url, extract_dir, show_download_progress=True):
+    """
+    Downloads the gzipped tarball at @url and extracts it into @extract_dir. The archive is streamed directly into the
+    extractor, so it is never written to disk in its compressed form. The archive's top-level folder is stripped,
+    equivalent to tar's --strip-components=1
+
+    Args:
+        url (str): URL of the .tar.gz archive to download
+        extract_dir (str): Directory to extract the archive's contents into
+        show_download_progress (bool): Whether to display a progress bar while downloading. Should be False when
+            running multiple downloads concurrently, since they would all share the same progress bar
+    """
+    with urlopen(url) as response:
+        reader = _ProgressReader(stream=response, total_size=int(response.headers.get("Content-Length", 0))) if \
+            show_download_progress else response
+        extract_tarball_stream(fileobj=reader, extract_dir=extract_dir)
+
+
+def _is_safe_relpath(path):
+    """
+    Args:
+        path (str): Archive member path or link target
+
+    Returns:
+        bool: Whether @path is a relative path that cannot escape the directory it is resolved against
+    """
+    return not os.path.isabs(path) and ".." not in path.split("/")
+
+
+def extract_tarball_stream(fileobj, extract_dir):
+    """
+    Extracts the gzipped tarball streamed from @fileobj into @extract_dir, stripping the archive's top-level folder
+    (equivalent to tar's --strip-components=1). Members, as well as link targets, that are absolute or would escape
+    @extract_dir are skipped
+
+    Args:
+        fileobj (file-like): Readable binary stream of the .tar.gz archive
+        extract_dir (str): Directory to extract the archive's contents into
+    """
+    def strip_top_level(name):
+        parts = name.split("/", 1)
+        return parts[1] if len(parts) == 2 else ""
+
+    # Use tarfile's own sanitization on top of the checks below where it is available
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else dict()
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for member in tar:
+            is_link = member.islnk() or member.issym()
+            # Check the paths both before and after stripping, since stripping can hide an absolute path
+            # (e.g. "/etc/passwd" -> "etc/passwd") or expose one (e.g. "og_dataset//etc/passwd" -> "/etc/passwd")
+            if not _is_safe_relpath(member.name) or (is_link and not _is_safe_relpath(member.linkname)):
+                continue
+            member.name = strip_top_level(member.name)
+            # Skip the top-level folder itself, as well as anything that would escape @extract_dir
+            if member.name == "" or not _is_safe_relpath(member.name):
+                continue
+            if member.islnk():
+                # Hardlink targets are archive member names, so they need to be stripped as well
+                member.linkname = strip_top_level(member.linkname)
+                if member.linkname == "" or not _is_safe_relpath(member.linkname):
+                    continue
+            tar.extract(member, path=extract_dir, **extract_kwargs)
+
+
 def is_dot_file(p):
     """
     Check if a filename starts with a dot.
@@ -48,17 +147,22 @@ def is_dot_file(p):
     return p.startswith(".")
 
 
-def get_og_avg_category_specs():
+def clear_asset_caches():
     """
-    Load average object specs (dimension and mass) for objects
-
-    Returns:
-        dict: Average category specifications for all object categories
+    Clears all cached dataset metadata and listings. Should be called whenever the contents or location of the
+    dataset change, e.g.: after downloading it or changing the data path
     """
-    avg_obj_dim_file = os.path.join(gm.DATASET_PATH, "metadata", "avg_category_specs.json")
+    _load_og_avg_category_specs.cache_clear()
+    _load_og_category_ids.cache_clear()
+    _list_object_categories.cache_clear()
+
+
+@cache
+def _load_og_avg_category_specs(dataset_path):
+    avg_obj_dim_file = os.path.join(dataset_path, "metadata", "avg_category_specs.json")
     if os.path.exists(avg_obj_dim_file):
-        with open(avg_obj_dim_file) as f:
-            return json.load(f)
+        with open(avg_obj_dim_file, "rb") as f:
+            return json_loads(f.read())
     else:
         log.warning(
             "Requested average specs of the object categories in the OmniGibson Dataset of objects, but the "
@@ -67,20 +171,45 @@ def get_og_avg_category_specs():
         return dict()
 
 
-def get_og_category_ids():
+def get_og_avg_category_specs():
     """
-    Get OmniGibson object categories
+    Load average object specs (dimension and mass) for objects. The file is only read once per dataset path, and a
+    copy of the cached specs is returned so callers can freely modify it
 
     Returns:
-        str: file path to the scene name
+        dict: Average category specifications for all object categories
     """
-    og_dataset_path = gm.DATASET_PATH
-    og_categories_files = os.path.join(og_dataset_path, "metadata", "categories.txt")
-    name_to_id = {}
+    return deepcopy(_load_og_avg_category_specs(gm.DATASET_PATH))
+
+
+class _CategoryIds(dict):
+    """
+    Category name to id mapping where unknown categories map to 255. Unlike a defaultdict, looking up an unknown
+    category does not insert it
+    """
+    def __missing__(self, key):
+        return 255
+
+
+@cache
+def _load_og_category_ids(dataset_path):
+    og_categories_files = os.path.join(dataset_path, "metadata", "categories.txt")
+    name_to_id = _CategoryIds()
     with open(og_categories_files, "r") as fp:
-        for i, l in enumerate(fp.readlines()):
+        for i, l in enumerate(fp):
             name_to_id[l.rstrip()] = i
-    return defaultdict(lambda: 255, name_to_id)
+    return MappingProxyType(name_to_id)
+
+
+def get_og_category_ids():
+    """
+    Get OmniGibson object categories. The file is only read once per dataset path, and the same read-only mapping is
+    returned on every call
+
+    Returns:
+        MappingProxyType: Read-only mapping from category name to category id, with unknown categories mapping to 255
+    """
+    return _load_og_category_ids(gm.DATASET_PATH)
 
 
 def get_available_og_scenes():
@@ -163,23 +292,67 @@ def get_all_system_categories():
     return sorted(categories)
 
 
+@cache
+def _list_object_categories(dataset_path):
+    og_categories_path = os.path.join(dataset_path, "objects")
+    return tuple(sorted(f for f in os.listdir(og_categories_path) if not is_dot_file(f)))
+
+
 def get_all_object_categories():
     """
-    Get OmniGibson all object categories
+    Get OmniGibson all object categories. The dataset is only listed once per dataset path
 
     Returns:
         list: all object categories
     """
-    og_dataset_path = gm.DATASET_PATH
-    og_categories_path = os.path.join(og_dataset_path, "objects")
+    return list(_list_object_categories(gm.DATASET_PATH))
+
+
+def _load_listing_cache(cache_file, cache_key):
+    """
+    Loads a dataset listing previously written by _save_listing_cache. The cache is stored as plain JSON rather than
+    pickled, since it lives in the (downloaded) dataset directory and must not be able to execute code when loaded
+
+    Args:
+        cache_file (str): Path to the JSON listing
+        cache_key (dict): JSON-compatible key describing the current state of the listed directory
+
+    Returns:
+        None or list: The cached listing if it exists, is well-formed and was generated with @cache_key, otherwise None
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cache = json_loads(f.read())
+        cached_key, listing = cache["key"], cache["listing"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if cached_key != cache_key or not isinstance(listing, list) or not all(isinstance(x, str) for x in listing):
+        return None
+    return listing
 
-    categories =[f for f in os.listdir(og_categories_path) if not is_dot_file(f)]
-    return sorted(categories)
+
+def _save_listing_cache(cache_file, cache_key, listing):
+    """
+    Writes dataset listing @listing generated with key @cache_key to @cache_file as JSON. Failures (e.g.: a read-only
+    dataset) are not fatal, since the listing can always be regenerated
+
+    Args:
+        cache_file (str): Path to write the JSON listing to
+        cache_key (dict): JSON-compatible key describing the current state of the listed directory
+        listing (list of str): Listing to cache
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump({"key": cache_key, "listing": listing}, f)
+    except OSError as e:
+        log.debug(f"Could not write dataset listing cache {cache_file}: {e}")
 
 
 def get_all_object_models():
     """
-    Get OmniGibson all object models
+    Get OmniGibson all object models. If gm.ENABLE_ASSET_LISTING_CACHE is set, the listing is cached on disk and only
+    regenerated when the set of categories or any category folder's modification time changes
 
     Returns:
         list: all object model paths
@@ -187,16 +360,43 @@ def get_all_object_models():
     og_dataset_path = gm.DATASET_PATH
     og_categories_path = os.path.join(og_dataset_path, "objects")
 
-    categories = os.listdir(og_categories_path)
-    categories = [item for item in categories if os.path.isdir(os.path.join(og_categories_path, item))]
+    # Use scandir so that the directory checks reuse the file types returned by the directory listing itself instead
+    # of requiring a separate stat call per entry. Check for hidden folders (e.g.: .git) first, so that we never
+    # descend into them
+    with os.scandir(og_categories_path) as entries:
+        categories = [entry for entry in entries if not is_dot_file(entry.name) and entry.is_dir()]
+
+    # Model paths are built by plain string concatenation, since os.path.join is comparatively slow when called for
+    # every model in the dataset
+    models_prefix = f"{og_categories_path}{os.sep}"
+
+    # Adding or removing a model (category) updates its category (the objects) folder's modification time, so the
+    # cached listing is valid as long as these modification times are unchanged
+    cache_file, cache_key = None, None
+    if gm.ENABLE_ASSET_LISTING_CACHE:
+        cache_file = os.path.join(og_dataset_path, ".cache", "object_models.json")
+        cache_key = {
+            "objects_mtime_ns": os.stat(og_categories_path).st_mtime_ns,
+            "categories": sorted([category.name, category.stat().st_mtime_ns] for category in categories),
+        }
+        models = _load_listing_cache(cache_file=cache_file, cache_key=cache_key)
+        if models is not None:
+            return [f"{models_prefix}{model}" for model in models]
+
     models = []
     for category in categories:
-        category_models = os.listdir(os.path.join(og_categories_path, category))
-        category_models = [
-            item for item in category_models if os.path.isdir(os.path.join(og_categories_path, category, item))
-        ]
-        models.extend([os.path.join(og_categories_path, category, item) for item in category_models])
-    return sorted(models)
+        category_prefix = f"{category.name}{os.sep}"
+        with os.scandir(category.path) as category_models:
+            models.extend(
+                f"{category_prefix}{model.name}"
+                for model in category_models if not is_dot_file(model.name) and model.is_dir()
+            )
+    models.sort()
+
+    if cache_file is not None:
+        _save_listing_cache(cache_file=cache_file, cache_key=cache_key, listing=models)
+
+    return [f"{models_prefix}{model}" for model in models]
 
 
 def get_all_object_category_models(category):
@@ -274,14 +474,24 @@ def get_all_object_category_models_with_abilities(category, abilities):
                     return False
         return True
 
-    for model in all_models:
-        usd_path = DatasetObject.get_usd_path(category=category, model=model)
-        usd_path = usd_path.replace(".usd", ".encrypted.usd")
-        with decrypted(usd_path) as fpath:
-            stage = lazy.pxr.Usd.Stage.Open(fpath)
-            prim = stage.GetDefaultPrim()
-            if supports_abilities(abilities_info, prim):
-                valid_models.append(model)
+    # Decrypt the next few models in the background while the current one is being checked. Decryption is mostly
+    # (Fernet) CPU time, so only a small, bounded number of models is decrypted ahead of the checks. Each model
+    # decrypts to its own temporary file, so this is safe to do in parallel
+    def check_model(model, decrypt_future):
+        stage = lazy.pxr.Usd.Stage.Open(decrypt_future.result())
+        prim = stage.GetDefaultPrim()
+        if supports_abilities(abilities_info, prim):
+            valid_models.append(model)
+
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=m.MAX_DECRYPT_WORKERS) as executor:
+        for model in all_models:
+            usd_path = DatasetObject.get_usd_path(category=category, model=model).replace(".usd", ".encrypted.usd")
+            pending.append((model, executor.submit(_decrypt_to_tempfile, usd_path)))
+            if len(pending) > m.MAX_DECRYPT_WORKERS:
+                check_model(*pending.popleft())
+        while pending:
+            check_model(*pending.popleft())
 
     return valid_models
 
@@ -349,6 +559,31 @@ def get_scene_path(scene_id):
     return os.path.join(data_path, scene_id)
 
 
+_MTLLIB_PATTERN = re.compile(rb"^[ \t]*mtllib[ \t]+(\S+)", re.MULTILINE)
+_MAP_KD_PATTERN = re.compile(rb"^[ \t]*map_Kd[ \t]+(\S+)", re.MULTILINE)
+
+
+def _search_file(fpath, pattern):
+    """
+    Searches file @fpath for the first match of bytes regex @pattern. The file is memory-mapped, so it is scanned
+    directly by the regex engine and never read into / decoded as a Python string
+
+    Args:
+        fpath (str): Path to the file to search
+        pattern (re.Pattern): Compiled bytes pattern with a single capture group
+
+    Returns:
+        None or str: The first match's captured group, or None if there is no match
+    """
+    with open(fpath, "rb") as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = pattern.search(mm)
+            return None if match is None else match.group(1).decode()
+
+
 def get_texture_file(mesh_file):
     """
     Get texture file
@@ -360,43 +595,23 @@ def get_texture_file(mesh_file):
         str: texture file path
     """
     model_dir = os.path.dirname(mesh_file)
-    with open(mesh_file, "r") as f:
-        lines = [line.strip() for line in f.readlines() if "mtllib" in line]
-        if len(lines) == 0:
-            return
-        mtl_file = lines[0].split()[1]
-        mtl_file = os.path.join(model_dir, mtl_file)
-
-    with open(mtl_file, "r") as f:
-        lines = [line.strip() for line in f.readlines() if "map_Kd" in line]
-        if len(lines) == 0:
-            return
-        texture_file = lines[0].split()[1]
-        texture_file = os.path.join(model_dir, texture_file)
+    mtl_name = _search_file(mesh_file, _MTLLIB_PATTERN)
+    if mtl_name is None:
+        return
+    mtl_file = os.path.join(model_dir, mtl_name)
 
-    return texture_file
+    texture_name = _search_file(mtl_file, _MAP_KD_PATTERN)
+    if texture_name is None:
+        return
+    texture_file = os.path.join(model_dir, texture_name)
 
-
-def download_assets():
-    """
-    Download OmniGibson assets
-    """
-    if os.path.exists(gm.ASSET_PATH):
-        print("Assets already downloaded.")
-    else:
-        with tempfile.TemporaryDirectory() as td:
-            tmp_file = os.path.join(td, "og_assets.tar.gz")
-            os.makedirs(gm.ASSET_PATH, exist_ok=True)
-            path = "https://storage.googleapis.com/gibson_scenes/og_assets_1_0_0.tar.gz"
-            log.info(f"Downloading and decompressing demo OmniGibson assets from {path}")
-            assert urlretrieve(path, tmp_file, show_progress), "Assets download failed."
-            assert subprocess.call(["tar", "-zxf", tmp_file, "--strip-components=1", "--directory", gm.ASSET_PATH]) == 0, "Assets extraction failed."
-            # These datasets come as folders; in these folder there are scenes, so --strip-components are needed.
+    return texture_file
 
 
-def download_demo_data():
+def install_dataset_key():
     """
-    Download OmniGibson demo dataset
+    Installs the OmniGibson dataset encryption key, if it is not installed already. This requires the user to agree to
+    the dataset's license
     """
     # Print user agreement
     if os.path.exists(gm.KEY_PATH):
@@ -414,15 +629,38 @@ def download_demo_data():
 
         download_key()
 
+
+def download_assets(show_download_progress=True):
+    """
+    Download OmniGibson assets
+
+    Args:
+        show_download_progress (bool): Whether to display a progress bar while downloading
+    """
+    if os.path.exists(gm.ASSET_PATH):
+        print("Assets already downloaded.")
+    else:
+        os.makedirs(gm.ASSET_PATH, exist_ok=True)
+        path = "https://storage.googleapis.com/gibson_scenes/og_assets_1_0_0.tar.gz"
+        log.info(f"Downloading and decompressing demo OmniGibson assets from {path}")
+        # These datasets come as folders; in these folder there are scenes, so the top-level folder is stripped.
+        download_and_extract(url=path, extract_dir=gm.ASSET_PATH, show_download_progress=show_download_progress)
+
+
+def download_demo_data():
+    """
+    Download OmniGibson demo dataset
+    """
+    install_dataset_key()
+
     if os.path.exists(gm.DATASET_PATH):
         print("OmniGibson dataset already installed.")
     else:
-        tmp_file = os.path.join(tempfile.gettempdir(), "og_dataset.tar.gz")
         os.makedirs(gm.DATASET_PATH, exist_ok=True)
         path = "https://storage.googleapis.com/gibson_scenes/og_dataset_demo_1_0_0.tar.gz"
         log.info(f"Downloading and decompressing demo OmniGibson dataset from {path}")
-        assert urlretrieve(path, tmp_file, show_progress), "Dataset download failed."
-        assert subprocess.call(["tar", "-zxf", tmp_file, "--strip-components=1", "--directory", gm.DATASET_PATH]) == 0, "Dataset extraction failed."
+        download_and_extract(url=path, extract_dir=gm.DATASET_PATH)
+        clear_asset_caches()
 
 
 def print_user_agreement():
@@ -445,36 +683,24 @@ def download_key():
         assert urlretrieve(path, gm.KEY_PATH, show_progress), "Key download failed."
 
 
-def download_og_dataset():
+def download_og_dataset(show_download_progress=True):
     """
     Download OmniGibson dataset
-    """
-    # Print user agreement
-    if os.path.exists(gm.KEY_PATH):
-        print("OmniGibson dataset encryption key already installed.")
-    else:
-        print("\n")
-        print_user_agreement()
-        while (
-            input(
-                "Do you agree to the above terms for using OmniGibson dataset? [y/n]"
-            )
-            != "y"
-        ):
-            print("You need to agree to the terms for using OmniGibson dataset.")
 
-        download_key()
+    Args:
+        show_download_progress (bool): Whether to display a progress bar while downloading
+    """
+    install_dataset_key()
 
     if os.path.exists(gm.DATASET_PATH):
         print("OmniGibson dataset already installed.")
     else:
-        tmp_file = os.path.join(tempfile.gettempdir(), "og_dataset.tar.gz")
         os.makedirs(gm.DATASET_PATH, exist_ok=True)
         path = "https://storage.googleapis.com/gibson_scenes/og_dataset_1_0_0.tar.gz"
         log.info(f"Downloading and decompressing OmniGibson dataset from {path}")
-        assert urlretrieve(path, tmp_file, show_progress), "Dataset download failed."
-        assert subprocess.call(["tar", "-zxf", tmp_file, "--strip-components=1", "--directory", gm.DATASET_PATH]) == 0, "Dataset extraction failed."
-        # These datasets come as folders; in these folder there are scenes, so --strip-components are needed.
+        # These datasets come as folders; in these folder there are scenes, so the top-level folder is stripped.
+        download_and_extract(url=path, extract_dir=gm.DATASET_PATH, show_download_progress=show_download_progress)
+        clear_asset_caches()
 
 
 def change_data_path():
@@ -482,7 +708,7 @@ def change_data_path():
     Changes the data paths for this repo
     """
     with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "global_config.yaml")) as f:
-        global_config = yaml.load(f, Loader=yaml.FullLoader)
+        global_config = yaml.load(f, Loader=SafeLoader)
     print("Current dataset path:")
     for k, v in global_config.items():
         print("{}: {}".format(k, v))
@@ -496,13 +722,30 @@ def change_data_path():
     response = input("Save? [y/n]")
     if response == "y":
         with open(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "global_config.yaml"), "w") as f:
-            yaml.dump(global_config, f)
+            yaml.dump(global_config, f, Dumper=SafeDumper)
+        clear_asset_caches()
 
 
-def decrypt_file(encrypted_filename, decrypted_filename):
-    with open(gm.KEY_PATH, "rb") as filekey:
+@cache
+def _get_fernet(key_path):
+    """
+    Args:
+        key_path (str): Path to the dataset encryption key
+
+    Returns:
+        Fernet: Cipher using the key at @key_path. This is only created once per key path, so that the key file does
+            not need to be re-read (and the cipher rebuilt) for every encrypted file
+    """
+    # Import here since cryptography is only needed when actually encrypting / decrypting files
+    from cryptography.fernet import Fernet
+
+    with open(key_path, "rb") as filekey:
         key = filekey.read()
-    fernet = Fernet(key)
+    return Fernet(key)
+
+
+def decrypt_file(encrypted_filename, decrypted_filename):
+    fernet = _get_fernet(gm.KEY_PATH)
 
     with open(encrypted_filename, "rb") as enc_f:
         encrypted = enc_f.read()
@@ -514,9 +757,7 @@ def decrypt_file(encrypted_filename, decrypted_filename):
 
 
 def encrypt_file(original_filename, encrypted_filename=None, encrypted_file=None):
-    with open(gm.KEY_PATH, "rb") as filekey:
-        key = filekey.read()
-    fernet = Fernet(key)
+    fernet = _get_fernet(gm.KEY_PATH)
 
     with open(original_filename, "rb") as org_f:
         original = org_f.read()
@@ -530,12 +771,16 @@ def encrypt_file(original_filename, encrypted_filename=None, encrypted_file=None
             encrypted_file.write(encrypted)
 
 
-@contextlib.contextmanager
-def decrypted(encrypted_filename):
+def _decrypt_to_tempfile(encrypted_filename):
     fpath = Path(encrypted_filename)
     decrypted_filename = os.path.join(og.tempdir, f"{fpath.stem}.tmp{fpath.suffix}")
     decrypt_file(encrypted_filename=encrypted_filename, decrypted_filename=decrypted_filename)
-    yield decrypted_filename
+    return decrypted_filename
+
+
+@contextlib.contextmanager
+def decrypted(encrypted_filename):
+    yield _decrypt_to_tempfile(encrypted_filename)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,8 @@ class LazyImporter(ModuleType):
         if name not in self._not_module:
             submodule = self._get_module(name)
             if submodule:
+                # Cache on the instance so that future lookups don't go through __getattr__
+                setattr(self, name, submodule)
                 return submodule
             else:
                 # Record module not found so that we don't keep looking.
@@ -24,12 +26,17 @@ class LazyImporter(ModuleType):
 
         # If it's not a module name, try it as a member of this module.
         try:
-            return getattr(self._module, name)
+            member = getattr(self._module, name)
         except:
             raise AttributeError(
                 f"module {self.__name__} has no attribute {name}"
             ) from None
 
+        # Only cache classes / functions, since plain module-level values may be rebound later on
+        if callable(member):
+            setattr(self, name, member)
+        return member
+
     def _get_module(self, module_name: str):
         """Recursively create and return a LazyImporter for the given module name."""
 
@@ -1,6 +1,6 @@
 import numpy as np
 
-from omnigibson.macros import gm, create_module_macros
+from omnigibson.macros import create_module_macros
 from omnigibson.utils.ui_utils import suppress_omni_log
 import omnigibson as og
 import omnigibson.lazy as lazy
@@ -54,23 +54,24 @@ def create_physx_particle_system(
         particle_system.GetGlobalSelfCollisionEnabledAttr().Set(False)
         particle_system.GetNonParticleCollisionEnabledAttr().Set(False)
 
+    prim = particle_system.GetPrim()
+
     if anisotropy:
         # apply api and use all defaults
-        lazy.pxr.PhysxSchema.PhysxParticleAnisotropyAPI.Apply(particle_system.GetPrim())
+        ani_api = lazy.pxr.PhysxSchema.PhysxParticleAnisotropyAPI.Apply(prim)
 
     if smoothing:
         # apply api and use all defaults
-        lazy.pxr.PhysxSchema.PhysxParticleSmoothingAPI.Apply(particle_system.GetPrim())
+        lazy.pxr.PhysxSchema.PhysxParticleSmoothingAPI.Apply(prim)
 
     if isosurface:
         # apply api and use all defaults
-        lazy.pxr.PhysxSchema.PhysxParticleIsosurfaceAPI.Apply(particle_system.GetPrim())
+        lazy.pxr.PhysxSchema.PhysxParticleIsosurfaceAPI.Apply(prim)
         # Make sure we're not casting shadows
-        primVarsApi = lazy.pxr.UsdGeom.PrimvarsAPI(particle_system.GetPrim())
+        primVarsApi = lazy.pxr.UsdGeom.PrimvarsAPI(prim)
         primVarsApi.CreatePrimvar("doNotCastShadows", lazy.pxr.Sdf.ValueTypeNames.Bool).Set(True)
         # tweak anisotropy min, max, and scale to work better with isosurface:
         if anisotropy:
-            ani_api = lazy.pxr.PhysxSchema.PhysxParticleAnisotropyAPI.Apply(particle_system.GetPrim())
             ani_api.CreateScaleAttr().Set(5.0)
             ani_api.CreateMinAttr().Set(1.0)  # avoids gaps in surface
             ani_api.CreateMaxAttr().Set(2.0)
@@ -157,8 +158,8 @@ def create_physx_particleset_pointinstancer(
     stage.DefinePrim(prim_path, "Scope")
 
     # Create point instancer
+    # Note: no need to check whether the instancer prim already exists, since its parent scope was just created
     instancer_prim_path = f"{prim_path}/instancer"
-    assert not stage.GetPrimAtPath(instancer_prim_path), f"Cannot create a PointInstancer prim, prim already exists at {instancer_prim_path}!"
     instancer = lazy.pxr.UsdGeom.PointInstancer.Define(stage, instancer_prim_path)
 
     is_isosurface = particle_system.HasAPI(lazy.pxr.PhysxSchema.PhysxParticleIsosurfaceAPI) and \
@@ -167,11 +168,26 @@ def create_physx_particleset_pointinstancer(
     # Add prototype mesh prim paths to the prototypes relationship attribute for this point set
     # We need to make copies of prototypes for each instancer currently because particles won't render properly
     # if multiple instancers share the same prototypes for some reason
-    mesh_list = instancer.GetPrototypesRel()
+    copied_prim_paths = [f"{prim_path}/prototype{i}" for i in range(len(prototype_prim_paths))]
+
+    # Copy all prototypes directly at the Sdf level within a single change block, so that the stage only recomposes
+    # once and we bypass the command / undo stack. This is only valid for prototypes fully defined by a single spec in
+    # the current edit layer, so any other prototype falls back to the (slower, composition-aware) CopyPrim command
+    layer = stage.GetEditTarget().GetLayer()
+    copy_via_sdf = []
+    for original_path in prototype_prim_paths:
+        prim_stack = stage.GetPrimAtPath(original_path).GetPrimStack()
+        copy_via_sdf.append(len(prim_stack) == 1 and prim_stack[0].layer == layer)
+    with lazy.pxr.Sdf.ChangeBlock():
+        for original_path, prototype_prim_path, via_sdf in zip(prototype_prim_paths, copied_prim_paths, copy_via_sdf):
+            if via_sdf:
+                lazy.pxr.Sdf.CopySpec(layer, original_path, layer, prototype_prim_path)
+    for original_path, prototype_prim_path, via_sdf in zip(prototype_prim_paths, copied_prim_paths, copy_via_sdf):
+        if not via_sdf:
+            lazy.omni.kit.commands.execute("CopyPrim", path_from=original_path, path_to=prototype_prim_path)
+
     prototype_prims = []
-    for i, original_path in enumerate(prototype_prim_paths):
-        prototype_prim_path = f"{prim_path}/prototype{i}"
-        lazy.omni.kit.commands.execute("CopyPrim", path_from=original_path, path_to=prototype_prim_path)
+    for prototype_prim_path in copied_prim_paths:
         prototype_prim = lazy.omni.isaac.core.utils.prims.get_prim_at_path(prototype_prim_path)
         # Make sure this prim is invisible if we're using isosurface, and vice versa.
         imageable = lazy.pxr.UsdGeom.Imageable(prototype_prim)
@@ -183,19 +199,31 @@ def create_physx_particleset_pointinstancer(
         # Move the prototype to the graveyard position so that it won't be visible to the agent
         # We can't directly hide the prototype because it will also hide all the generated particles (if not isosurface)
         prototype_prim.GetAttribute("xformOp:translate").Set(m.PROTOTYPE_GRAVEYARD_POS)
-
-        mesh_list.AddTarget(lazy.pxr.Sdf.Path(prototype_prim_path))
         prototype_prims.append(prototype_prim)
 
+    # Set all prototype targets at once
+    instancer.GetPrototypesRel().SetTargets([lazy.pxr.Sdf.Path(path) for path in copied_prim_paths])
+
     # Set particle instance default data
-    prototype_indices = [0] * n_particles if prototype_indices is None else prototype_indices
+    # All per-particle arrays are built as contiguous float32 so that they match the USD array types directly
+    prototype_indices = np.zeros(n_particles, dtype=np.int32) if prototype_indices is None else \
+        np.asarray(prototype_indices, dtype=np.int32)
+    # USD expects w,x,y,z ordering
+    orientations_wxyz = np.empty((n_particles, 4), dtype=np.float32)
     if orientations is None:
-        orientations = np.zeros((n_particles, 4))
-        orientations[:, -1] = 1.0
-    orientations = np.array(orientations)[:, [3, 0, 1, 2]]  # x,y,z,w --> w,x,y,z
-    velocities = np.zeros((n_particles, 3)) if velocities is None else velocities
-    angular_velocities = np.zeros((n_particles, 3)) if angular_velocities is None else angular_velocities
-    scales = np.ones((n_particles, 3)) if scales is None else scales
+        orientations_wxyz[:, 0] = 1.0
+        orientations_wxyz[:, 1:] = 0.0
+    else:
+        orientations = np.asarray(orientations)
+        orientations_wxyz[:, 0] = orientations[:, 3]
+        orientations_wxyz[:, 1:] = orientations[:, :3]
+    positions = np.ascontiguousarray(positions, dtype=np.float32)
+    velocities = np.zeros((n_particles, 3), dtype=np.float32) if velocities is None else \
+        np.ascontiguousarray(velocities, dtype=np.float32)
+    angular_velocities = np.zeros((n_particles, 3), dtype=np.float32) if angular_velocities is None else \
+        np.ascontiguousarray(angular_velocities, dtype=np.float32)
+    scales = np.ones((n_particles, 3), dtype=np.float32) if scales is None else \
+        np.ascontiguousarray(scales, dtype=np.float32)
     assert particle_mass is not None or particle_density is not None, \
         "Either particle mass or particle density must be specified when creating particle instancer!"
     particle_mass = 0.0 if particle_mass is None else particle_mass
@@ -204,7 +232,7 @@ def create_physx_particleset_pointinstancer(
     # Set particle states
     instancer.GetProtoIndicesAttr().Set(prototype_indices)
     instancer.GetPositionsAttr().Set(lazy.pxr.Vt.Vec3fArray.FromNumpy(positions))
-    instancer.GetOrientationsAttr().Set(lazy.pxr.Vt.QuathArray.FromNumpy(orientations))
+    instancer.GetOrientationsAttr().Set(lazy.pxr.Vt.QuathArray.FromNumpy(orientations_wxyz))
     instancer.GetVelocitiesAttr().Set(lazy.pxr.Vt.Vec3fArray.FromNumpy(velocities))
     instancer.GetAngularVelocitiesAttr().Set(lazy.pxr.Vt.Vec3fArray.FromNumpy(angular_velocities))
     instancer.GetScalesAttr().Set(lazy.pxr.Vt.Vec3fArray.FromNumpy(scales))
@@ -6,12 +6,13 @@ import contextlib
 import logging
 import numpy as np
 import sys
+import time
 import datetime
 from pathlib import Path
 from PIL import Image
 from termcolor import colored
 import omnigibson as og
-from omnigibson.macros import gm
+from omnigibson.macros import gm, create_module_macros
 import omnigibson.utils.transform_utils as T
 import omnigibson.lazy as lazy
 from scipy.spatial.transform import Rotation as R
@@ -20,6 +21,34 @@ from scipy.integrate import quad
 import imageio
 from IPython import embed
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Minimum time (s) between teleop status printouts while the same key is held
+m.TELEOP_PRINT_INTERVAL = 0.1
+
+
+def _quat2mat_column(quat, axis):
+    """
+    Computes a single column of the rotation matrix corresponding to quaternion @quat. This is equivalent to
+    T.quat2mat(quat)[:, axis], but uses plain scalar math, which is much cheaper for a single quaternion
+
+    Args:
+        quat (np.array): (x,y,z,w) quaternion, which does not need to be normalized
+        axis (int): Which column (0, 1, or 2) of the rotation matrix to compute
+
+    Returns:
+        3-tuple: (x,y,z) values of column @axis of the rotation matrix
+    """
+    x, y, z, w = float(quat[0]), float(quat[1]), float(quat[2]), float(quat[3])
+    s = 2.0 / (x * x + y * y + z * z + w * w)
+    if axis == 0:
+        return 1.0 - s * (y * y + z * z), s * (x * y + z * w), s * (x * z - y * w)
+    elif axis == 1:
+        return s * (x * y - z * w), 1.0 - s * (x * x + z * z), s * (y * z + x * w)
+    else:
+        return s * (x * z + y * w), s * (y * z - x * w), 1.0 - s * (x * x + y * y)
+
 
 def print_icon():
     raw_texts = [
@@ -91,6 +120,10 @@ class KeyboardEventHandler:
     # Global keyboard callbacks
     KEYBOARD_CALLBACKS = dict()
 
+    # Global callbacks that receive every keyboard event. Stored as a tuple so that callbacks can safely be added /
+    # removed while events are being dispatched
+    EVENT_CALLBACKS = tuple()
+
     # ID assigned to meta callback method for this class
     _CALLBACK_ID = None
 
@@ -100,8 +133,11 @@ class KeyboardEventHandler:
     @classmethod
     def initialize(cls):
         """
-        Hook up a meta function callback to the omni backend
+        Hook up a meta function callback to the omni backend. This is a no-op if it is already hooked up, so that
+        every keyboard event is only ever dispatched once
         """
+        if cls._CALLBACK_ID is not None:
+            return
         appwindow = lazy.omni.appwindow.get_default_app_window()
         input_interface = lazy.carb.input.acquire_input_interface()
         keyboard = appwindow.get_keyboard()
@@ -117,6 +153,7 @@ class KeyboardEventHandler:
         keyboard = appwindow.get_keyboard()
         input_interface.unsubscribe_to_keyboard_events(keyboard, cls._CALLBACK_ID)
         cls.KEYBOARD_CALLBACKS = dict()
+        cls.EVENT_CALLBACKS = tuple()
         cls._CALLBACK_ID = None
 
     @classmethod
@@ -138,16 +175,52 @@ class KeyboardEventHandler:
         # Add the callback
         cls.KEYBOARD_CALLBACKS[key] = callback_fn
 
+    @classmethod
+    def add_event_callback(cls, callback_fn):
+        """
+        Registers a callback function that receives every keyboard event. This allows multiple keyboard consumers to
+        share the single subscription to omni's backend owned by this class
+
+        Args:
+            callback_fn (function): Callback function to call for every keyboard event. Note that this function's
+                signature should be:
+
+                callback_fn(event) --> None
+        """
+        # Initialize the interface if not initialized yet
+        if cls._CALLBACK_ID is None:
+            cls.initialize()
+        # Add the callback
+        cls.EVENT_CALLBACKS = cls.EVENT_CALLBACKS + (callback_fn,)
+
+    @classmethod
+    def remove_event_callback(cls, callback_fn):
+        """
+        Removes a callback function previously registered via add_event_callback()
+
+        Args:
+            callback_fn (function): Callback function to remove
+        """
+        cls.EVENT_CALLBACKS = tuple(fn for fn in cls.EVENT_CALLBACKS if fn != callback_fn)
+
     @classmethod
     def _meta_callback(cls, event, *args, **kwargs):
         """
         Meta callback function that is hooked up to omni's backend
         """
-        # Check if we've received a key press or repeat
-        if event.type == lazy.carb.input.KeyboardEventType.KEY_PRESS \
-                or event.type == lazy.carb.input.KeyboardEventType.KEY_REPEAT:
-            # Run the specific callback
-            cls.KEYBOARD_CALLBACKS.get(event.input, lambda: None)()
+        # Run all callbacks that listen to every event
+        for callback_fn in cls.EVENT_CALLBACKS:
+            callback_fn(event)
+
+        # Immediately skip keys without any callback, which are the vast majority of events
+        callback_fn = cls.KEYBOARD_CALLBACKS.get(event.input)
+        if callback_fn is None:
+            return True
+
+        # Check if we've received a key press or repeat, and run the specific callback if so
+        event_types, event_type = lazy.carb.input.KeyboardEventType, event.type
+        if event_type == event_types.KEY_PRESS or event_type == event_types.KEY_REPEAT:
+            callback_fn()
 
         # Always return True
         return True
@@ -237,13 +310,15 @@ def disclaimer(msg):
     next release!
     """
     if gm.SHOW_DISCLAIMERS:
-        print("****** DISCLAIMER ******")
-        print("Isaac Sim / Omniverse has some significant limitations and bugs in its current release.")
-        print("This message has popped up because a potential feature in OmniGibson relies upon a feature in Omniverse that "
-              "is yet to be released publically. Currently, the expected behavior may not be fully functional, but "
-              "should be resolved by the next Isaac Sim release.")
-        print(f"Exact Limitation: {msg}")
-        print("************************")
+        sys.stdout.write(
+            "****** DISCLAIMER ******\n"
+            "Isaac Sim / Omniverse has some significant limitations and bugs in its current release.\n"
+            "This message has popped up because a potential feature in OmniGibson relies upon a feature in Omniverse that "
+            "is yet to be released publically. Currently, the expected behavior may not be fully functional, but "
+            "should be resolved by the next Isaac Sim release.\n"
+            f"Exact Limitation: {msg}\n"
+            "************************\n"
+        )
 
 
 def debug_breakpoint(msg):
@@ -264,27 +339,35 @@ def choose_from_options(options, name, random_selection=False):
     Returns:
         str: Requested option
     """
+    # Materialize the options only once
+    option_names = list(options)
+    n_options = len(option_names)
+
     # Select robot
-    print("\nHere is a list of available {}s:\n".format(name))
+    lines = ["\nHere is a list of available {}s:\n".format(name)]
 
-    for k, option in enumerate(options):
-        docstring = ": {}".format(options[option]) if isinstance(options, dict) else ""
-        print("[{}] {}{}".format(k + 1, option, docstring))
-    print()
+    if isinstance(options, dict):
+        for k, (option, docstring) in enumerate(options.items()):
+            lines.append("[{}] {}: {}".format(k + 1, option, docstring))
+    else:
+        for k, option in enumerate(option_names):
+            lines.append("[{}] {}".format(k + 1, option))
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if not random_selection:
         try:
-            s = input("Choose a {} (enter a number from 1 to {}): ".format(name, len(options)))
+            s = input("Choose a {} (enter a number from 1 to {}): ".format(name, n_options))
             # parse input into a number within range
-            k = min(max(int(s), 1), len(options)) - 1
+            k = min(max(int(s), 1), n_options) - 1
         except ValueError:
             k = 0
-            print("Input is not valid. Use {} by default.".format(list(options)[k]))
+            print("Input is not valid. Use {} by default.".format(option_names[k]))
     else:
-        k = np.random.choice(range(len(options)))
+        k = np.random.choice(range(n_options))
 
     # Return requested option
-    return list(options)[k]
+    return option_names[k]
 
 
 class CameraMover:
@@ -306,16 +389,40 @@ class CameraMover:
         self.light_val = gm.FORCE_LIGHT_INTENSITY
         self.save_dir = save_dir
 
-        self._appwindow = lazy.omni.appwindow.get_default_app_window()
-        self._input = lazy.carb.input.acquire_input_interface()
-        self._keyboard = self._appwindow.get_keyboard()
-        self._sub_keyboard = self._input.subscribe_to_keyboard_events(self._keyboard, self._sub_keyboard_event)
+        # Keypress mappings are static, so build them once instead of on every keyboard event. Each movement command
+        # only moves along a single camera frame axis, so it is stored as (axis, sign) and scaled by self.delta
+        self._input_to_function = {
+            lazy.carb.input.KeyboardInput.O: lambda: self.record_image(fpath=None),
+            lazy.carb.input.KeyboardInput.P: lambda: self.print_cam_pose(),
+            lazy.carb.input.KeyboardInput.KEY_9: lambda: self.change_light(delta=-2e4),
+            lazy.carb.input.KeyboardInput.KEY_0: lambda: self.change_light(delta=2e4),
+        }
+        self._input_to_command = {
+            lazy.carb.input.KeyboardInput.D: (0, 1.0),
+            lazy.carb.input.KeyboardInput.A: (0, -1.0),
+            lazy.carb.input.KeyboardInput.W: (2, -1.0),
+            lazy.carb.input.KeyboardInput.S: (2, 1.0),
+            lazy.carb.input.KeyboardInput.T: (1, 1.0),
+            lazy.carb.input.KeyboardInput.G: (1, -1.0),
+        }
+        # Combined dispatch table mapping keypresses to (function, args, whether to also run on key repeat), so that
+        # each keyboard event only needs a single lookup. Functions are only triggered on the initial keypress, while
+        # movement commands are also applied while the key is held down
+        self._input_to_dispatch = {key: (fn, (), False) for key, fn in self._input_to_function.items()}
+        self._input_to_dispatch.update(
+            {key: (self._move_cam, command, True) for key, command in self._input_to_command.items()}
+        )
+
+        # Scratch buffer for the global camera displacement, to avoid allocating a new array per keypress
+        self._delta_pos = np.empty(3)
+
+        KeyboardEventHandler.add_event_callback(self._sub_keyboard_event)
 
     def clear(self):
         """
         Clears this camera mover. After this is called, the camera mover cannot be used.
         """
-        self._input.unsubscribe_to_keyboard_events(self._keyboard, self._sub_keyboard)
+        KeyboardEventHandler.remove_event_callback(self._sub_keyboard_event)
 
     def set_save_dir(self, save_dir):
         """
@@ -502,33 +609,38 @@ class CameraMover:
         """
         self.cam = cam
 
+    def _move_cam(self, axis, sign):
+        """
+        Moves the camera by self.delta along one of its local axes
+
+        Args:
+            axis (int): Which local camera axis (0, 1, or 2) to move along
+            sign (float): Direction (1.0 or -1.0) to move along @axis
+        """
+        # Convert to world frame to move the camera. Since the command only moves along a single local axis,
+        # this is just the corresponding column of the camera's rotation matrix, scaled by the delta
+        pos, quat = self.cam.get_position_orientation()
+        col_x, col_y, col_z = _quat2mat_column(quat, axis)
+        scale = sign * self.delta
+        self._delta_pos[:] = (col_x * scale, col_y * scale, col_z * scale)
+        self.cam.set_position(pos + self._delta_pos)
+
     @property
     def input_to_function(self):
         """
         Returns:
             dict: Mapping from relevant keypresses to corresponding function call to use
         """
-        return {
-            lazy.carb.input.KeyboardInput.O: lambda: self.record_image(fpath=None),
-            lazy.carb.input.KeyboardInput.P: lambda: self.print_cam_pose(),
-            lazy.carb.input.KeyboardInput.KEY_9: lambda: self.change_light(delta=-2e4),
-            lazy.carb.input.KeyboardInput.KEY_0: lambda: self.change_light(delta=2e4),
-        }
+        return self._input_to_function
 
     @property
     def input_to_command(self):
         """
         Returns:
-            dict: Mapping from relevant keypresses to corresponding delta command to apply to the camera pose
-        """
-        return {
-            lazy.carb.input.KeyboardInput.D: np.array([self.delta, 0, 0]),
-            lazy.carb.input.KeyboardInput.A: np.array([-self.delta, 0, 0]),
-            lazy.carb.input.KeyboardInput.W: np.array([0, 0, -self.delta]),
-            lazy.carb.input.KeyboardInput.S: np.array([0, 0, self.delta]),
-            lazy.carb.input.KeyboardInput.T: np.array([0, self.delta, 0]),
-            lazy.carb.input.KeyboardInput.G: np.array([0, -self.delta, 0]),
-        }
+            dict: Mapping from relevant keypresses to corresponding (axis, sign) command to apply to the camera pose,
+                where the camera moves by sign * self.delta along its local @axis
+        """
+        return self._input_to_command
 
     def _sub_keyboard_event(self, event, *args, **kwargs):
         """
@@ -537,20 +649,15 @@ class CameraMover:
         Args:
             event (int): keyboard event type
         """
-        if event.type == lazy.carb.input.KeyboardEventType.KEY_PRESS \
-                or event.type == lazy.carb.input.KeyboardEventType.KEY_REPEAT:
-
-            if event.type == lazy.carb.input.KeyboardEventType.KEY_PRESS and event.input in self.input_to_function:
-                self.input_to_function[event.input]()
+        # Immediately skip keys that are not mapped to anything
+        dispatch = self._input_to_dispatch.get(event.input)
+        if dispatch is None:
+            return True
 
-            else:
-                command = self.input_to_command.get(event.input, None)
-
-                if command is not None:
-                    # Convert to world frame to move the camera
-                    transform = T.quat2mat(self.cam.get_orientation())
-                    delta_pos_global = transform @ command
-                    self.cam.set_position(self.cam.get_position() + delta_pos_global)
+        fn, args, run_on_repeat = dispatch
+        event_types, event_type = lazy.carb.input.KeyboardEventType, event.type
+        if event_type == event_types.KEY_PRESS or (run_on_repeat and event_type == event_types.KEY_REPEAT):
+            fn(*args)
 
         return True
 
@@ -560,36 +667,40 @@ class KeyboardRobotController:
     Simple class for controlling OmniGibson robots using keyboard commands
     """
 
-    def __init__(self, robot):
+    def __init__(self, robot, verbose=True):
         """
         Args:
             robot (BaseRobot): robot to control
+            verbose (bool): Whether to print out the current keypress and action when generating teleop actions
         """
         # Store relevant info from robot
         self.robot = robot
+        self.verbose = verbose
         self.action_dim = robot.action_dim
         self.controller_info = dict()
         self.joint_idx_to_controller = dict()
         idx = 0
         for name, controller in robot._controllers.items():
+            dofs = controller.dof_idx.tolist()
             self.controller_info[name] = {
                 "name": type(controller).__name__,
                 "start_idx": idx,
-                "dofs": controller.dof_idx,
+                "dofs": dofs,
                 "command_dim": controller.command_dim,
             }
             idx += controller.command_dim
-            for i in controller.dof_idx:
+            for i in dofs:
                 self.joint_idx_to_controller[i] = controller
 
         # Other persistent variables we need to keep track of
-        self.joint_names = [name for name in robot.joints.keys()]  # Ordered list of joint names belonging to the robot
-        self.joint_types = [joint.joint_type for joint in robot.joints.values()]    # Ordered list of joint types
+        self.joint_names = tuple(robot.joints)  # Ordered joint names belonging to the robot
+        self.joint_types = tuple(joint.joint_type for joint in robot.joints.values())    # Ordered joint types
         self.joint_command_idx = None   # Indices of joints being directly controlled in the action array
         self.joint_control_idx = None  # Indices of joints being directly controlled in the actual joint array
         self.active_joint_command_idx_idx = 0   # Which index within the joint_command_idx variable is being controlled by the user
         self.current_joint = -1  # Active joint being controlled for joint control
         self.ik_arms = []               # List of arm controller names to be controlled by IK
+        self.arm_keypress_mappings = None   # Maps each arm in self.ik_arms to its keypress mapping
         self.active_arm_idx = 0         # Which index within self.ik_arms is actively being controlled (only relevant for IK)
         self.binary_grippers = []           # Grippers being controlled using multi-finger binary controller
         self.active_gripper_idx = 0     # Which index within self.binary_grippers is actively being controlled
@@ -601,6 +712,13 @@ class KeyboardRobotController:
         self.active_action = None       # Current action information based on the current keypress
         self.toggling_gripper = False   # Whether we should toggle the gripper during the next action
         self.custom_keymapping = None   # Dictionary mapping custom keys to custom callback functions / info
+        self.keypress_handlers = None   # Maps omni keybindings to special (non-action) callback functions
+        self.gripper_toggle_val = None  # Action value for toggling binary grippers, if any
+        self._binary_gripper_start_idx = None   # (name, action start index) for each binary gripper
+        self._joint_control_enabled = False     # Whether any joints are directly controlled via "[" and "]"
+        self._binary_gripper_control_enabled = False    # Whether any grippers are controlled via binary toggling
+        self._last_print_time = 0.0     # Time of the last teleop status printout
+        self._last_printed_keypress = None  # Keypress shown in the last teleop status printout
 
         # Populate the keypress mapping dictionary
         self.populate_keypress_mapping()
@@ -612,10 +730,7 @@ class KeyboardRobotController:
         """
         Sets up the keyboard callback functionality with omniverse
         """
-        appwindow = lazy.omni.appwindow.get_default_app_window()
-        input_interface = lazy.carb.input.acquire_input_interface()
-        keyboard = appwindow.get_keyboard()
-        sub_keyboard = input_interface.subscribe_to_keyboard_events(keyboard, self.keyboard_event_handler)
+        KeyboardEventHandler.add_event_callback(self.keyboard_event_handler)
 
     def register_custom_keymapping(self, key, description, callback_fn):
         """
@@ -644,18 +759,18 @@ class KeyboardRobotController:
         """
         mapping = {}
 
-        mapping[lazy.carb.input.KeyboardInput.UP] = {"idx": controller_info["start_idx"] + 0, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.DOWN] = {"idx": controller_info["start_idx"] + 0, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.RIGHT] = {"idx": controller_info["start_idx"] + 1, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.LEFT] = {"idx": controller_info["start_idx"] + 1, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.P] = {"idx": controller_info["start_idx"] + 2, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.SEMICOLON] = {"idx": controller_info["start_idx"] + 2, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.N] = {"idx": controller_info["start_idx"] + 3, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.B] = {"idx": controller_info["start_idx"] + 3, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.O] = {"idx": controller_info["start_idx"] + 4, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.U] = {"idx": controller_info["start_idx"] + 4, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.V] = {"idx": controller_info["start_idx"] + 5, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.C] = {"idx": controller_info["start_idx"] + 5, "val": -0.5}
+        mapping[lazy.carb.input.KeyboardInput.UP] = (controller_info["start_idx"] + 0, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.DOWN] = (controller_info["start_idx"] + 0, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.RIGHT] = (controller_info["start_idx"] + 1, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.LEFT] = (controller_info["start_idx"] + 1, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.P] = (controller_info["start_idx"] + 2, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.SEMICOLON] = (controller_info["start_idx"] + 2, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.N] = (controller_info["start_idx"] + 3, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.B] = (controller_info["start_idx"] + 3, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.O] = (controller_info["start_idx"] + 4, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.U] = (controller_info["start_idx"] + 4, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.V] = (controller_info["start_idx"] + 5, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.C] = (controller_info["start_idx"] + 5, -0.5)
 
         return mapping
 
@@ -672,28 +787,26 @@ class KeyboardRobotController:
         """
         mapping = {}
 
-        mapping[lazy.carb.input.KeyboardInput.UP] = {"idx": controller_info["start_idx"] + 0, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.DOWN] = {"idx": controller_info["start_idx"] + 0, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.RIGHT] = {"idx": controller_info["start_idx"] + 1, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.LEFT] = {"idx": controller_info["start_idx"] + 1, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.P] = {"idx": controller_info["start_idx"] + 2, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.SEMICOLON] = {"idx": controller_info["start_idx"] + 2, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.N] = {"idx": controller_info["start_idx"] + 3, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.B] = {"idx": controller_info["start_idx"] + 3, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.O] = {"idx": controller_info["start_idx"] + 4, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.U] = {"idx": controller_info["start_idx"] + 4, "val": -0.5}
-        mapping[lazy.carb.input.KeyboardInput.V] = {"idx": controller_info["start_idx"] + 5, "val": 0.5}
-        mapping[lazy.carb.input.KeyboardInput.C] = {"idx": controller_info["start_idx"] + 5, "val": -0.5}
+        mapping[lazy.carb.input.KeyboardInput.UP] = (controller_info["start_idx"] + 0, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.DOWN] = (controller_info["start_idx"] + 0, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.RIGHT] = (controller_info["start_idx"] + 1, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.LEFT] = (controller_info["start_idx"] + 1, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.P] = (controller_info["start_idx"] + 2, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.SEMICOLON] = (controller_info["start_idx"] + 2, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.N] = (controller_info["start_idx"] + 3, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.B] = (controller_info["start_idx"] + 3, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.O] = (controller_info["start_idx"] + 4, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.U] = (controller_info["start_idx"] + 4, -0.5)
+        mapping[lazy.carb.input.KeyboardInput.V] = (controller_info["start_idx"] + 5, 0.5)
+        mapping[lazy.carb.input.KeyboardInput.C] = (controller_info["start_idx"] + 5, -0.5)
 
         return mapping
 
     def populate_keypress_mapping(self):
         """
-        Populates the mapping @self.keypress_mapping, which maps keypresses to action info:
+        Populates the mapping @self.keypress_mapping, which maps keypresses to (idx, val) action info:
 
-            keypress:
-                idx: <int>
-                val: <float>
+            keypress: (<int> idx, <float> val)
         """
         self.keypress_mapping = {}
         self.joint_command_idx = []
@@ -701,101 +814,136 @@ class KeyboardRobotController:
         self.gripper_direction = {}
         self.persistent_gripper_action = {}
         self.custom_keymapping = {}
+        self.arm_keypress_mappings = {}
 
         # Add mapping for joint control directions (no index because these are inferred at runtime)
-        self.keypress_mapping[lazy.carb.input.KeyboardInput.RIGHT_BRACKET] = {"idx": None, "val": 0.1}
-        self.keypress_mapping[lazy.carb.input.KeyboardInput.LEFT_BRACKET] = {"idx": None, "val": -0.1}
+        self.keypress_mapping[lazy.carb.input.KeyboardInput.RIGHT_BRACKET] = (None, 0.1)
+        self.keypress_mapping[lazy.carb.input.KeyboardInput.LEFT_BRACKET] = (None, -0.1)
 
         # Iterate over all controller info and populate mapping
         for component, info in self.controller_info.items():
             if info["name"] == "JointController":
-                for i in range(info["command_dim"]):
-                    cmd_idx = info["start_idx"] + i
-                    self.joint_command_idx.append(cmd_idx)
-                self.joint_control_idx += info["dofs"].tolist()
+                self.joint_command_idx.extend(range(info["start_idx"], info["start_idx"] + info["command_dim"]))
+                self.joint_control_idx.extend(info["dofs"])
             elif info["name"] == "DifferentialDriveController":
-                self.keypress_mapping[lazy.carb.input.KeyboardInput.I] = {"idx": info["start_idx"] + 0, "val": 0.4}
-                self.keypress_mapping[lazy.carb.input.KeyboardInput.K] = {"idx": info["start_idx"] + 0, "val": -0.4}
-                self.keypress_mapping[lazy.carb.input.KeyboardInput.L] = {"idx": info["start_idx"] + 1, "val": -0.2}
-                self.keypress_mapping[lazy.carb.input.KeyboardInput.J] = {"idx": info["start_idx"] + 1, "val": 0.2}
+                self.keypress_mapping[lazy.carb.input.KeyboardInput.I] = (info["start_idx"] + 0, 0.4)
+                self.keypress_mapping[lazy.carb.input.KeyboardInput.K] = (info["start_idx"] + 0, -0.4)
+                self.keypress_mapping[lazy.carb.input.KeyboardInput.L] = (info["start_idx"] + 1, -0.2)
+                self.keypress_mapping[lazy.carb.input.KeyboardInput.J] = (info["start_idx"] + 1, 0.2)
             elif info["name"] == "InverseKinematicsController":
                 self.ik_arms.append(component)
-                self.keypress_mapping.update(self.generate_ik_keypress_mapping(controller_info=info))
+                self.arm_keypress_mappings[component] = self.generate_ik_keypress_mapping(controller_info=info)
             elif info["name"] == "OperationalSpaceController":
                 self.ik_arms.append(component)
-                self.keypress_mapping.update(self.generate_osc_keypress_mapping(controller_info=info))
+                self.arm_keypress_mappings[component] = self.generate_osc_keypress_mapping(controller_info=info)
             elif info["name"] == "MultiFingerGripperController":
                 if info["command_dim"] > 1:
-                    for i in range(info["command_dim"]):
-                        cmd_idx = info["start_idx"] + i
-                        self.joint_command_idx.append(cmd_idx)
-                    self.joint_control_idx += info["dofs"].tolist()
+                    self.joint_command_idx.extend(range(info["start_idx"], info["start_idx"] + info["command_dim"]))
+                    self.joint_control_idx.extend(info["dofs"])
                 else:
-                    self.keypress_mapping[lazy.carb.input.KeyboardInput.T] = {"idx": info["start_idx"], "val": 1.0}
+                    self.keypress_mapping[lazy.carb.input.KeyboardInput.T] = (info["start_idx"], 1.0)
                     self.gripper_direction[component] = 1.0
                     self.persistent_gripper_action[component] = 1.0
                     self.binary_grippers.append(component)
             elif info["name"] == "NullJointController":
                 # We won't send actions if using a null gripper controller
-                self.keypress_mapping[lazy.carb.input.KeyboardInput.T] = {"idx": None, "val": None}
+                self.keypress_mapping[lazy.carb.input.KeyboardInput.T] = (None, None)
             else:
                 raise ValueError("Unknown controller name received: {}".format(info["name"]))
 
+        # Only the active arm's mapping should be used. All arms share the same keys, so switching arms simply
+        # overwrites these entries with the new arm's (pre-generated) mapping
+        if len(self.ik_arms) > 0:
+            self.keypress_mapping.update(self.arm_keypress_mappings[self.ik_arms[self.active_arm_idx]])
+
+        # Store the value for toggling the gripper and the grippers' action indices directly, since they are needed on
+        # every teleop step
+        self.gripper_toggle_val = self.keypress_mapping.get(lazy.carb.input.KeyboardInput.T, (None, None))[1]
+        self._binary_gripper_start_idx = \
+            [(binary_gripper, self.controller_info[binary_gripper]["start_idx"]) for binary_gripper in self.binary_grippers]
+        # Also cache which kinds of teleop actions are available at all, which are checked on every teleop step
+        self._joint_control_enabled = len(self.joint_command_idx) > 0
+        self._binary_gripper_control_enabled = len(self.binary_grippers) > 0 and self.gripper_toggle_val is not None
+
+        # Populate the special keypress handlers. Which ones are available depends on the controllers found above, so
+        # these are built once here instead of being re-checked on every keyboard event
+        self.keypress_handlers = {}
+        if len(self.joint_control_idx) > 1:
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_1] = lambda: self._change_active_joint(delta=-1)
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_2] = lambda: self._change_active_joint(delta=1)
+        if len(self.ik_arms) > 1:
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_3] = lambda: self._change_active_arm(delta=-1)
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_4] = lambda: self._change_active_arm(delta=1)
+        if len(self.binary_grippers) > 1:
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_5] = lambda: self._change_active_gripper(delta=-1)
+            self.keypress_handlers[lazy.carb.input.KeyboardInput.KEY_6] = lambda: self._change_active_gripper(delta=1)
+        # Render the sensor modalities from the robot's camera and lidar
+        self.keypress_handlers[lazy.carb.input.KeyboardInput.M] = lambda: self.robot.visualize_sensors()
+
+    def _change_active_joint(self, delta):
+        """
+        Updates the joint being controlled and prints out the new joint
+
+        Args:
+            delta (int): Change in the index of the active joint, clipped to the valid range
+        """
+        self.active_joint_command_idx_idx = \
+            min(len(self.joint_control_idx) - 1, max(0, self.active_joint_command_idx_idx + delta))
+        print(f"Now controlling joint {self.joint_names[self.joint_control_idx[self.active_joint_command_idx_idx]]}")
+
+    def _change_active_arm(self, delta):
+        """
+        Updates the arm being controlled, updates the keypress mapping, and prints out the new arm
+
+        Args:
+            delta (int): Change in the index of the active arm, clipped to the valid range
+        """
+        self.active_arm_idx = min(len(self.ik_arms) - 1, max(0, self.active_arm_idx + delta))
+        new_arm = self.ik_arms[self.active_arm_idx]
+        self.keypress_mapping.update(self.arm_keypress_mappings[new_arm])
+        print(f"Now controlling arm {new_arm} with IK")
+
+    def _change_active_gripper(self, delta):
+        """
+        Updates the gripper being controlled and prints out the new gripper
+
+        Args:
+            delta (int): Change in the index of the active gripper, clipped to the valid range
+        """
+        self.active_gripper_idx = min(len(self.binary_grippers) - 1, max(0, self.active_gripper_idx + delta))
+        print(f"Now controlling gripper {self.binary_grippers[self.active_gripper_idx]} with binary toggling")
+
     def keyboard_event_handler(self, event, *args, **kwargs):
         # Check if we've received a key press or repeat
-        if event.type == lazy.carb.input.KeyboardEventType.KEY_PRESS \
-                or event.type == lazy.carb.input.KeyboardEventType.KEY_REPEAT:
-
-            # Handle special cases
-            if event.input in {lazy.carb.input.KeyboardInput.KEY_1, lazy.carb.input.KeyboardInput.KEY_2} and len(self.joint_control_idx) > 1:
-                # Update joint and print out new joint being controlled
-                self.active_joint_command_idx_idx = max(0, self.active_joint_command_idx_idx - 1) \
-                    if event.input == lazy.carb.input.KeyboardInput.KEY_1 \
-                    else min(len(self.joint_control_idx) - 1, self.active_joint_command_idx_idx + 1)
-                print(f"Now controlling joint {self.joint_names[self.joint_control_idx[self.active_joint_command_idx_idx]]}")
-
-            elif event.input in {lazy.carb.input.KeyboardInput.KEY_3, lazy.carb.input.KeyboardInput.KEY_4} and len(self.ik_arms) > 1:
-                # Update arm, update keypress mapping, and print out new arm being controlled
-                self.active_arm_idx = max(0, self.active_arm_idx - 1) \
-                    if event.input == lazy.carb.input.KeyboardInput.KEY_3 \
-                    else min(len(self.ik_arms) - 1, self.active_arm_idx + 1)
-                new_arm = self.ik_arms[self.active_arm_idx]
-                self.keypress_mapping.update(self.generate_ik_keypress_mapping(self.controller_info[new_arm]))
-                print(f"Now controlling arm {new_arm} with IK")
-
-            elif event.input in {lazy.carb.input.KeyboardInput.KEY_5, lazy.carb.input.KeyboardInput.KEY_6} and len(self.binary_grippers) > 1:
-                # Update gripper, update keypress mapping, and print out new gripper being controlled
-                self.active_gripper_idx = max(0, self.active_gripper_idx - 1) \
-                    if event.input == lazy.carb.input.KeyboardInput.KEY_5 \
-                    else min(len(self.binary_grippers) - 1, self.active_gripper_idx + 1)
-                print(f"Now controlling gripper {self.binary_grippers[self.active_gripper_idx]} with binary toggling")
-
-            elif event.input == lazy.carb.input.KeyboardInput.M:
-                # Render the sensor modalities from the robot's camera and lidar
-                self.robot.visualize_sensors()
-
-            elif event.input in self.custom_keymapping:
-                # Run custom press
-                self.custom_keymapping[event.input]["callback"]()
-
-            elif event.input == lazy.carb.input.KeyboardInput.ESCAPE:
+        keys, event_types, event_type = lazy.carb.input.KeyboardInput, lazy.carb.input.KeyboardEventType, event.type
+        if event_type == event_types.KEY_PRESS or event_type == event_types.KEY_REPEAT:
+
+            # Handle special cases first, falling back to custom keymappings
+            handler = self.keypress_handlers.get(event.input)
+            if handler is None and event.input in self.custom_keymapping:
+                handler = self.custom_keymapping[event.input]["callback"]
+
+            if handler is not None:
+                handler()
+
+            elif event.input == keys.ESCAPE:
                 # Terminate immediately
                 og.shutdown()
 
             else:
                 # Handle all other actions and update accordingly
-                self.active_action = self.keypress_mapping.get(event.input, None)
+                self.active_action = self.keypress_mapping.get(event.input)
 
-            if event.type == lazy.carb.input.KeyboardEventType.KEY_PRESS:
+            if event_type == event_types.KEY_PRESS:
                 # Store the current keypress
                 self.current_keypress = event.input
 
                 # Also store whether we pressed the key for toggling gripper actions
-                if event.input == lazy.carb.input.KeyboardInput.T:
+                if event.input == keys.T:
                     self.toggling_gripper = True
 
         # If we release a key, clear the active action and keypress
-        elif event.type == lazy.carb.input.KeyboardEventType.KEY_RELEASE:
+        elif event_type == event_types.KEY_RELEASE:
             self.active_action = None
             self.current_keypress = None
 
@@ -818,12 +966,12 @@ class KeyboardRobotController:
 
         # Handle the action if any key is actively being pressed
         if self.active_action is not None:
-            idx, val = self.active_action["idx"], self.active_action["val"]
+            idx, val = self.active_action
 
             # Only handle the action if the value is specified
             if val is not None:
                 # If there is no index, the user is controlling a joint with "[" and "]"
-                if idx is None and len(self.joint_command_idx) != 0:
+                if idx is None and self._joint_control_enabled:
                     idx = self.joint_command_idx[self.active_joint_command_idx_idx]
 
                     # Also potentially modify the value being deployed in we're controlling a prismatic joint
@@ -842,28 +990,36 @@ class KeyboardRobotController:
                     action[idx] = val
 
         # Possibly set the persistent gripper action
-        if len(self.binary_grippers) > 0 and self.keypress_mapping[lazy.carb.input.KeyboardInput.T]["val"] is not None:
-
-            for i, binary_gripper in enumerate(self.binary_grippers):
-                # Possibly update the stored value if the toggle gripper key has been pressed and
-                # it's the active gripper being controlled
-                if self.toggling_gripper and i == self.active_gripper_idx:
-                    # We toggle the gripper direction or this gripper
-                    self.gripper_direction[binary_gripper] *= -1.0
-                    self.persistent_gripper_action[binary_gripper] = \
-                        self.keypress_mapping[lazy.carb.input.KeyboardInput.T]["val"] * self.gripper_direction[binary_gripper]
-
-                    # Clear the toggling gripper flag
-                    self.toggling_gripper = False
-
-                # Set the persistent action
-                action[self.controller_info[binary_gripper]["start_idx"]] = self.persistent_gripper_action[binary_gripper]
-
-        # Print out the user what is being pressed / controlled
-        sys.stdout.write("\033[K")
-        keypress_str = self.current_keypress.__str__().split(".")[-1]
-        print("Pressed {}. Action: {}".format(keypress_str, action))
-        sys.stdout.write("\033[F")
+        if self._binary_gripper_control_enabled:
+
+            # Possibly update the stored value if the toggle gripper key has been pressed, only for the active gripper
+            # being controlled
+            if self.toggling_gripper:
+                # We toggle the gripper direction or this gripper
+                binary_gripper = self.binary_grippers[self.active_gripper_idx]
+                self.gripper_direction[binary_gripper] *= -1.0
+                self.persistent_gripper_action[binary_gripper] = \
+                    self.gripper_toggle_val * self.gripper_direction[binary_gripper]
+
+                # Clear the toggling gripper flag
+                self.toggling_gripper = False
+
+            # Set the persistent actions
+            for binary_gripper, start_idx in self._binary_gripper_start_idx:
+                action[start_idx] = self.persistent_gripper_action[binary_gripper]
+
+        # Print out the user what is being pressed / controlled. This is throttled while the same key is held, since
+        # printing every step would otherwise dominate the cost of generating the action
+        if self.verbose:
+            now = time.time()
+            if self.current_keypress != self._last_printed_keypress or \
+                    now - self._last_print_time > m.TELEOP_PRINT_INTERVAL:
+                sys.stdout.write("\033[K")
+                keypress_str = self.current_keypress.__str__().split(".")[-1]
+                print("Pressed {}. Action: {}".format(keypress_str, action))
+                sys.stdout.write("\033[F")
+                self._last_print_time = now
+                self._last_printed_keypress = self.current_keypress
 
         # Return action
         return action
@@ -873,48 +1029,52 @@ class KeyboardRobotController:
         Prints out relevant information for teleop controlling a robot
         """
 
-        def print_command(char, info):
-            char += " " * (10 - len(char))
-            print("{}\t{}".format(char, info))
+        # Collect all lines first so that the info is written out all at once
+        lines = []
 
-        print()
-        print("*" * 30)
-        print("Controlling the Robot Using the Keyboard")
-        print("*" * 30)
-        print()
-        print("Joint Control")
-        print_command("1, 2", "decrement / increment the joint to control")
-        print_command("[, ]", "move the joint backwards, forwards, respectively")
-        print()
-        print("Differential Drive Control")
-        print_command("i, k", "turn left, right")
-        print_command("l, j", "move forward, backwards")
-        print()
-        print("Inverse Kinematics Control")
-        print_command("3, 4", "toggle between the different arm(s) to control")
-        print_command(u"\u2190, \u2192", "translate arm eef along x-axis")
-        print_command(u"\u2191, \u2193", "translate arm eef along y-axis")
-        print_command("p, ;", "translate arm eef along z-axis")
-        print_command("n, b", "rotate arm eef about x-axis")
-        print_command("o, u", "rotate arm eef about y-axis")
-        print_command("v, c", "rotate arm eef about z-axis")
-        print()
-        print("Boolean Gripper Control")
-        print_command("5, 6", "toggle between the different gripper(s) using binary control")
-        print_command("t", "toggle gripper (open/close)")
-        print()
-        print("Sensor Rendering")
-        print_command("m", "render the onboard sensor modalities (RGB, Depth, Normals, Instance Segmentation, Occupancy Map)")
-        print()
+        def add_command(char, info):
+            char += " " * (10 - len(char))
+            lines.append("{}\t{}".format(char, info))
+
+        lines.append("")
+        lines.append("*" * 30)
+        lines.append("Controlling the Robot Using the Keyboard")
+        lines.append("*" * 30)
+        lines.append("")
+        lines.append("Joint Control")
+        add_command("1, 2", "decrement / increment the joint to control")
+        add_command("[, ]", "move the joint backwards, forwards, respectively")
+        lines.append("")
+        lines.append("Differential Drive Control")
+        add_command("i, k", "turn left, right")
+        add_command("l, j", "move forward, backwards")
+        lines.append("")
+        lines.append("Inverse Kinematics Control")
+        add_command("3, 4", "toggle between the different arm(s) to control")
+        add_command(u"\u2190, \u2192", "translate arm eef along x-axis")
+        add_command(u"\u2191, \u2193", "translate arm eef along y-axis")
+        add_command("p, ;", "translate arm eef along z-axis")
+        add_command("n, b", "rotate arm eef about x-axis")
+        add_command("o, u", "rotate arm eef about y-axis")
+        add_command("v, c", "rotate arm eef about z-axis")
+        lines.append("")
+        lines.append("Boolean Gripper Control")
+        add_command("5, 6", "toggle between the different gripper(s) using binary control")
+        add_command("t", "toggle gripper (open/close)")
+        lines.append("")
+        lines.append("Sensor Rendering")
+        add_command("m", "render the onboard sensor modalities (RGB, Depth, Normals, Instance Segmentation, Occupancy Map)")
+        lines.append("")
         if len(self.custom_keymapping) > 0:
-            print("Custom Keymappings")
+            lines.append("Custom Keymappings")
             for key, info in self.custom_keymapping.items():
                 key_str = key.__str__().split(".")[-1].lower()
-                print_command(key_str, info["description"])
-            print()
-        print("*" * 30)
-        print()
-        
+                add_command(key_str, info["description"])
+            lines.append("")
+        lines.append("*" * 30)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+
 def generate_box_edges(center, extents):
     """
     Generate the edges of a box given its center and extents.
@@ -971,9 +1131,8 @@ def draw_aabb(obj):
     """
     Draws the axis-aligned bounding box of a given object.
     """
-    ctr = obj.aabb_center
-    ext = obj.aabb_extent / 2.0
-    draw_box(ctr, ext)    
+    ctr, ext = obj.aabb_center_extent
+    draw_box(ctr, ext / 2.0)
 
 def clear_debug_drawing():
     """
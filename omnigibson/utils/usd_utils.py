@@ -535,7 +535,8 @@ class PoseAPI:
     def get_world_pose(cls, prim_path):
         cls._refresh()
         position, orientation = lazy.omni.isaac.core.utils.xforms.get_world_pose(prim_path)
-        return np.array(position), np.array(orientation)[[1, 2, 3, 0]]
+        # (w,x,y,z) -> (x,y,z,w)
+        return np.array(position), np.array((orientation[1], orientation[2], orientation[3], orientation[0]))
 
     @classmethod
     def get_world_pose_with_scale(cls, prim_path):
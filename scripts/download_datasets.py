@@ -2,10 +2,11 @@
 Helper script to download OmniGibson dataset and assets.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 os.environ["OMNIGIBSON_NO_OMNIVERSE"] = "1"
 
 from omnigibson.macros import gm
-from omnigibson.utils.asset_utils import download_og_dataset, download_assets
+from omnigibson.utils.asset_utils import download_og_dataset, download_assets, install_dataset_key
 import click
 
 
@@ -19,13 +20,27 @@ def main():
         print(f"    assets (~2.5GB): {gm.ASSET_PATH}")
         print(f"If you want to install data under a different path, please change the DATA_PATH variable in omnigibson/macros.py and rerun scripts/download_dataset.py.")
         if click.confirm("Do you want to continue?"):
+            if not (dataset_exists or assets_exist):
+                # Both are needed. Get the license agreement out of the way first, then download both concurrently
+                # since the downloads are network-bound
+                install_dataset_key()
+                print("Downloading dataset and assets...")
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = [
+                        executor.submit(download_og_dataset, show_download_progress=False),
+                        executor.submit(download_assets, show_download_progress=False),
+                    ]
+                    # Propagate any errors
+                    for future in futures:
+                        future.result()
+
             # Only download if the dataset path doesn't exist
-            if not dataset_exists:
+            elif not dataset_exists:
                 print("Downloading dataset...")
                 download_og_dataset()
 
             # Only download if the asset path doesn't exist
-            if not assets_exist:
+            else:
                 print("Downloading assets...")
                 download_assets()
 
@@ -1,4 +1,13 @@
-import omnigibson as og
+import sys
+
 
 def pytest_unconfigure(config):
-    og.shutdown()
+    # Only shut down the simulator if it was actually launched, so that sim-free tests (e.g. pure numpy kernels or
+    # file I/O helpers) can run without Isaac Sim
+    og = sys.modules.get("omnigibson")
+    if og is None:
+        return
+    if og.app is not None:
+        og.shutdown()
+    else:
+        og.cleanup()
@@ -0,0 +1,102 @@
+# These are pure file I/O checks, so these tests do not launch the simulator
+import io
+import os
+import tarfile
+
+import pytest
+
+from omnigibson.utils.asset_utils import _is_safe_relpath, extract_tarball_stream
+
+
+def _make_tarball(members):
+    """
+    Builds an in-memory .tar.gz archive from a list of (name, type, data_or_linkname) tuples
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, member_type, payload in members:
+            info = tarfile.TarInfo(name)
+            info.type = member_type
+            if member_type == tarfile.REGTYPE:
+                info.size = len(payload)
+                tar.addfile(info, io.BytesIO(payload))
+            elif member_type == tarfile.DIRTYPE:
+                info.mode = 0o755
+                tar.addfile(info)
+            else:
+                info.linkname = payload
+                tar.addfile(info)
+    buffer.seek(0)
+    return buffer
+
+
+def test_extract_tarball_stream_strips_top_level(tmp_path):
+    tarball = _make_tarball([
+        ("og_dataset", tarfile.DIRTYPE, None),
+        ("og_dataset/objects", tarfile.DIRTYPE, None),
+        ("og_dataset/objects/model.usd", tarfile.REGTYPE, b"usd"),
+        ("og_dataset/readme.txt", tarfile.REGTYPE, b"readme"),
+        ("og_dataset/readme_link.txt", tarfile.SYMTYPE, "readme.txt"),
+        ("og_dataset/readme_hardlink.txt", tarfile.LNKTYPE, "og_dataset/readme.txt"),
+    ])
+    extract_tarball_stream(fileobj=tarball, extract_dir=str(tmp_path))
+
+    assert not (tmp_path / "og_dataset").exists()
+    assert (tmp_path / "objects" / "model.usd").read_bytes() == b"usd"
+    assert (tmp_path / "readme.txt").read_bytes() == b"readme"
+    assert os.readlink(tmp_path / "readme_link.txt") == "readme.txt"
+    assert (tmp_path / "readme_hardlink.txt").read_bytes() == b"readme"
+
+
+def test_extract_tarball_stream_skips_unsafe_members(tmp_path):
+    extract_dir = tmp_path / "extract"
+    extract_dir.mkdir()
+    tarball = _make_tarball([
+        ("og_dataset/../../escaped.txt", tarfile.REGTYPE, b"bad"),
+        ("og_dataset//abs.txt", tarfile.REGTYPE, b"bad"),
+        ("og_dataset/abs_link", tarfile.SYMTYPE, str(tmp_path)),
+        ("og_dataset/parent_link", tarfile.SYMTYPE, ".."),
+        ("og_dataset/parent_link/escaped_via_link.txt", tarfile.REGTYPE, b"bad"),
+        ("og_dataset/abs_link/escaped_via_abs_link.txt", tarfile.REGTYPE, b"bad"),
+        ("og_dataset/hardlink", tarfile.LNKTYPE, "og_dataset/../../escaped.txt"),
+        ("og_dataset/ok.txt", tarfile.REGTYPE, b"ok"),
+    ])
+    extract_tarball_stream(fileobj=tarball, extract_dir=str(extract_dir))
+
+    assert (extract_dir / "ok.txt").read_bytes() == b"ok"
+    assert not any(path.is_symlink() for path in extract_dir.rglob("*"))
+    assert not (tmp_path / "escaped.txt").exists()
+    assert not (tmp_path / "escaped_via_link.txt").exists()
+    assert not (tmp_path / "escaped_via_abs_link.txt").exists()
+
+
+@pytest.mark.parametrize("path, is_safe", [
+    ("readme.txt", True),
+    ("objects/model.usd", True),
+    ("objects/..hidden/model.usd", True),
+    ("/etc/passwd", False),
+    ("..", False),
+    ("../escaped.txt", False),
+    ("objects/../../escaped.txt", False),
+])
+def test_is_safe_relpath(path, is_safe):
+    assert _is_safe_relpath(path) == is_safe
+
+
+@pytest.mark.parametrize("member", [
+    ("og_dataset/../escaped.txt", tarfile.REGTYPE, b"bad"),
+    ("/escaped.txt", tarfile.REGTYPE, b"bad"),
+    ("og_dataset/link", tarfile.SYMTYPE, "../escaped.txt"),
+    ("og_dataset/link", tarfile.SYMTYPE, "/escaped.txt"),
+    ("og_dataset/link", tarfile.LNKTYPE, "og_dataset/../escaped.txt"),
+    ("og_dataset/link", tarfile.LNKTYPE, "/escaped.txt"),
+])
+def test_extract_tarball_stream_skips_unsafe_member(tmp_path, member):
+    extract_dir = tmp_path / "extract"
+    extract_dir.mkdir()
+    tarball = _make_tarball([member, ("og_dataset/ok.txt", tarfile.REGTYPE, b"ok")])
+    extract_tarball_stream(fileobj=tarball, extract_dir=str(extract_dir))
+
+    # The unsafe member is skipped without aborting the rest of the extraction
+    assert sorted(os.listdir(extract_dir)) == ["ok.txt"]
+    assert not (tmp_path / "escaped.txt").exists()
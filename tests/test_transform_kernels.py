@@ -0,0 +1,107 @@
+# These kernels are pure numpy / numba code, so these tests do not launch the simulator
+import numpy as np
+
+import omnigibson.utils.transform_utils as T
+from omnigibson.prims.xform_prim import _quat_to_euler_xyz, _quat_to_mat3, _world_to_local_pose, _world_to_local_poses
+from omnigibson.utils.ui_utils import _quat2mat_column
+
+
+N_SAMPLES = 100
+
+
+def _random_quats(rng, n=N_SAMPLES, normalize=True):
+    quats = rng.normal(size=(n, 4))
+    return quats / np.linalg.norm(quats, axis=-1, keepdims=True) if normalize else quats
+
+
+def _random_pose_mat(rng, scale=None):
+    pose_mat = np.eye(4)
+    pose_mat[:3, :3] = T.quat2mat(_random_quats(rng, n=1)[0])
+    if scale is not None:
+        pose_mat[:3, :3] = pose_mat[:3, :3] * scale
+    pose_mat[:3, 3] = rng.uniform(-5.0, 5.0, size=3)
+    return pose_mat
+
+
+def test_quat_to_euler_xyz():
+    rng = np.random.default_rng(0)
+    for quat in _random_quats(rng):
+        assert np.allclose(_quat_to_euler_xyz(quat), T.quat2euler(quat), atol=1e-6)
+
+
+def test_quat_to_mat3():
+    rng = np.random.default_rng(1)
+    # The kernel does not require normalized quaternions
+    for quat in _random_quats(rng, normalize=False):
+        assert np.allclose(_quat_to_mat3(quat), T.quat2mat(quat), atol=1e-6)
+
+
+def test_quat2mat_column():
+    rng = np.random.default_rng(2)
+    for quat in _random_quats(rng, normalize=False):
+        mat = T.quat2mat(quat)
+        for axis in range(3):
+            assert np.allclose(_quat2mat_column(quat, axis), mat[:, axis], atol=1e-6)
+
+
+def test_world_to_local_pose():
+    rng = np.random.default_rng(3)
+    for quat in _random_quats(rng):
+        parent_tf = _random_pose_mat(rng)
+        pos = rng.uniform(-5.0, 5.0, size=3)
+        local_pos, local_orn = _world_to_local_pose(parent_tf, pos, quat)
+
+        world_mat = np.eye(4)
+        world_mat[:3, :3] = T.quat2mat(quat)
+        world_mat[:3, 3] = pos
+        expected_mat = T.pose_inv(parent_tf) @ world_mat
+
+        assert np.allclose(local_pos, expected_mat[:3, 3], atol=1e-6)
+        # Compare rotation matrices, since q and -q are the same orientation
+        assert np.allclose(T.quat2mat(local_orn), expected_mat[:3, :3], atol=1e-6)
+
+
+def test_world_to_local_pose_scaled_parent():
+    rng = np.random.default_rng(4)
+    for quat in _random_quats(rng):
+        scale = rng.uniform(0.1, 3.0, size=3)
+        parent_tf = _random_pose_mat(rng, scale=scale)
+        pos = rng.uniform(-5.0, 5.0, size=3)
+        local_pos, local_orn = _world_to_local_pose(parent_tf, pos, quat)
+
+        # Scale only affects the position, the orientation is relative to the unscaled parent rotation
+        assert np.allclose(local_pos, (np.linalg.inv(parent_tf) @ np.append(pos, 1.0))[:3], atol=1e-6)
+        assert np.allclose(
+            T.quat2mat(local_orn), (parent_tf[:3, :3] / scale).T @ T.quat2mat(quat), atol=1e-6
+        )
+
+
+def test_world_to_local_pose_reflected_parent():
+    rng = np.random.default_rng(5)
+    for quat in _random_quats(rng):
+        # Flip the sign of a random axis so that the parent transform is a reflection
+        scale = rng.uniform(0.1, 3.0, size=3)
+        scale[rng.integers(3)] *= -1.0
+        parent_tf = _random_pose_mat(rng, scale=scale)
+        pos = rng.uniform(-5.0, 5.0, size=3)
+        local_pos, local_orn = _world_to_local_pose(parent_tf, pos, quat)
+
+        assert np.isclose(np.linalg.norm(local_orn), 1.0, atol=1e-6)
+        assert np.allclose(local_pos, (np.linalg.inv(parent_tf) @ np.append(pos, 1.0))[:3], atol=1e-6)
+
+    # Pure mirror, which used to produce the non-unit quaternion [0, 0, 0, 0.707]
+    _, local_orn = _world_to_local_pose(np.diag([-1.0, 1.0, 1.0, 1.0]), np.zeros(3), np.array([0.0, 0.0, 0.0, 1.0]))
+    assert np.isclose(np.linalg.norm(local_orn), 1.0, atol=1e-6)
+
+
+def test_world_to_local_poses():
+    rng = np.random.default_rng(6)
+    parent_tfs = np.stack([_random_pose_mat(rng, scale=rng.uniform(0.1, 3.0, size=3)) for _ in range(N_SAMPLES)])
+    positions = rng.uniform(-5.0, 5.0, size=(N_SAMPLES, 3))
+    orientations = _random_quats(rng)
+    local_pos, local_orn = _world_to_local_poses(parent_tfs, positions, orientations)
+
+    for i in range(N_SAMPLES):
+        expected_pos, expected_orn = _world_to_local_pose(parent_tfs[i], positions[i], orientations[i])
+        assert np.allclose(local_pos[i], expected_pos)
+        assert np.allclose(local_orn[i], expected_orn)